@@ -1,21 +1,46 @@
 from fastapi import APIRouter, HTTPException, Query, Body
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime
+import asyncio
+import base64
+import json
+import logging
+import time
 import uuid
 
-from models.schemas import SearchRequest, SearchResponse, Lead, HealthResponse, OutreachRequest, BulkOutreachRequest, OutreachResponse, BulkOutreachResponse, MessageQualityAnalysis
+from models.schemas import SearchRequest, SearchResponse, LeadPage, TextSearchResponse, SourceTiming, JobStatus, ScrapeJob, ScrapeJobRequest, Lead, HealthResponse, OutreachRequest, BulkOutreachRequest, OutreachResponse, BulkOutreachResponse, MessageQualityAnalysis
 from services.apollo_client import apollo_client
+from services.search_cache import search_cache
+from services.browser_pool import browser_pool
+from services.lean_mode import scrape_metrics
+from services.host_scheduler import host_scheduler
+from services.job_service import JobQueueFullError, job_manager
+from services.admission import AdmissionRejectedError, scrape_admission
+from services.enrichment_service import enrichment_service
 from services.data_transformer import DataTransformer
+from services.source_adapters import normalize_all, normalize_stream, pipeline_metrics
+from services.dedup_service import lead_deduplicator
+from services.lead_store import lead_store
 from services.export_service import ExportService
 from services.scraper_service import scrape_apollo_companies, scrape_yellow_pages_companies
 from services.ai_outreach_service import AIOutreachService
 from core.config import settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 ai_outreach_service = AIOutreachService()
 
 @router.post("/search-leads", response_model=SearchResponse)
-async def search_leads(request: SearchRequest):
+async def search_leads(
+    request: SearchRequest,
+    max_pages: int = Query(default=1, ge=1, le=settings.MAX_SEARCH_PAGES, description="Maximum Apollo Result Pages to Fetch"),
+    max_results: Optional[int] = Query(default=None, ge=1, description="Maximum Number of Leads to Return"),
+    bypass_cache: bool = Query(default=False, description="Skip Cached Apollo Results & Refresh Them"),
+    enrich: bool = Query(default=False, description="Crawl Lead Websites for Emails, Phones & Social Links"),
+    resolve_contacts: bool = Query(default=False, description="Look Up Ranked Decision-Maker Contacts for Every Organization")
+):
     # Search for Leads Based on Industry and Location Using Apollo API
     if not apollo_client:
         raise HTTPException(
@@ -24,43 +49,33 @@ async def search_leads(request: SearchRequest):
         )
     
     try:
-        # Search Companies Using Apollo API
-        apollo_response = await apollo_client.search_companies(
+        # Search Companies Using Apollo API, Fetching Extra Pages Concurrently
+        apollo_response = await apollo_client.search_companies_pages(
             industry=request.industry,
             location=request.location,
-            per_page=settings.MAX_PAGE_SIZE
+            max_pages=max_pages,
+            per_page=settings.MAX_PAGE_SIZE,
+            max_results=max_results,
+            use_cache=not bypass_cache
         )
         
+        # Resolve Ranked Decision-Maker Contacts for Every Organization in Bulk
+        contacts_by_org = None
+        if resolve_contacts:
+            contacts_by_org = await apollo_client.search_people_for_organizations(
+                [company.get("id") for company in apollo_response.get("organizations", [])],
+                per_organization=settings.CONTACTS_PER_LEAD,
+                use_cache=not bypass_cache
+            )
+        
         # Transform Apollo Data to Lead Format
-        leads = []
-        companies = apollo_response.get("organizations", [])
-        people = apollo_response.get("people", [])
+        leads = apollo_response_to_leads(apollo_response, contacts_by_org)
         
-        # Create a Mapping of Organization ID to People
-        org_people_map = {}
-        for person in people:
-            org_id = person.get("organization_id")
-            if org_id:
-                if org_id not in org_people_map:
-                    org_people_map[org_id] = []
-                org_people_map[org_id].append(person)
+        if enrich:
+            leads = await enrichment_service.enrich_leads(leads)
         
-        # Process Companies & Associated People
-        for company in companies:
-            company_id = company.get("id")
-            associated_people = org_people_map.get(company_id, [{}])
-            
-            # Use the First Person as the Primary Contact
-            primary_person = associated_people[0] if associated_people else {}
-            
-            # Combine Company and Person Data
-            combined_data = {
-                "organization": company,
-                "person": primary_person
-            }
-            
-            lead = DataTransformer.transform_apollo_data_to_lead(combined_data)
-            leads.append(lead)
+        # Persist the Whole Search in One Write
+        await lead_store.put_leads(leads)
         
         return SearchResponse(
             leads=leads,
@@ -73,6 +88,57 @@ async def search_leads(request: SearchRequest):
             detail=f"Error searching leads: {str(e)}"
         )
 
+@router.post("/search-leads/stream")
+async def search_leads_stream(
+    request: SearchRequest,
+    format: str = Query(default="ndjson", pattern="^(ndjson|sse)$", description="Stream Format: 'ndjson' or 'sse'"),
+    max_pages: int = Query(default=1, ge=1, le=settings.STREAM_MAX_PAGES, description="Maximum Apollo Result Pages to Fetch"),
+    max_results: Optional[int] = Query(default=None, ge=1, description="Maximum Number of Leads to Return"),
+    bypass_cache: bool = Query(default=False, description="Skip Cached Apollo Results & Refresh Them")
+):
+    # Stream Leads One by One as Each Apollo Page Arrives
+    if not apollo_client:
+        raise HTTPException(
+            status_code=500,
+            detail="Apollo API Key Not Configured. Please Set APOLLO_API_KEY Environment Variable."
+        )
+    
+    def encode(event: str, data: str) -> str:
+        if format == "sse":
+            return f"event: {event}\ndata: {data}\n\n"
+        return f"{data}\n" if event == "lead" else f'{{"{event}": {data}}}\n'
+    
+    async def lead_events() -> AsyncIterator[str]:
+        total = 0
+        pending: List[Lead] = []
+        try:
+            records = apollo_client.iter_companies(
+                industry=request.industry,
+                location=request.location,
+                max_pages=max_pages,
+                per_page=settings.MAX_PAGE_SIZE,
+                max_results=max_results,
+                use_cache=not bypass_cache
+            )
+            async for lead in normalize_stream(records, "apollo_api"):
+                total += 1
+                pending.append(lead)
+                # Persist in Page-Sized Batches Rather Than per Lead
+                if len(pending) >= settings.MAX_PAGE_SIZE:
+                    await lead_store.put_leads(pending)
+                    pending = []
+                yield encode("lead", lead.model_dump_json())
+        except Exception as e:
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            yield encode("error", json.dumps({"detail": f"Error searching leads: {detail}", "total": total}))
+            return
+        finally:
+            await lead_store.put_leads(pending)
+        yield encode("done", json.dumps({"total": total}))
+    
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(lead_events(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
 @router.post("/scrape-leads-apollo", response_model=SearchResponse)
 async def scrape_leads_apollo(
     request: SearchRequest,
@@ -86,34 +152,17 @@ async def scrape_leads_apollo(
             max_pages=max_pages
         )
         
-        # Transform Scraped Data to Lead Format
-        leads = []
-        for company_data in scraped_companies:
-            # Create a Mock Structure Similar to Apollo API Response
-            mock_apollo_data = {
-                "organization": {
-                    "name": company_data.get("company", "Unknown Company"),
-                    "industry": company_data.get("industry", "Unknown"),
-                    "city": company_data.get("location", "").split(",")[0].strip() if company_data.get("location") else "",
-                    "state": company_data.get("location", "").split(",")[1].strip() if "," in company_data.get("location", "") else "",
-                    "website_url": company_data.get("website", "N/A"),
-                    "linkedin_url": company_data.get("linkedin_url", "N/A"),
-                    "estimated_num_employees": 0  
-                },
-                "person": {
-                    "name": "Contact not available",
-                    "email": ""
-                }
-            }
-            
-            lead = DataTransformer.transform_apollo_data_to_lead(mock_apollo_data)
-            leads.append(lead)
+        # Normalize Scraped Cards Straight Into Leads
+        leads = normalize_all(scraped_companies, "apollo")
+        await lead_store.put_leads(leads)
         
         return SearchResponse(
             leads=leads,
             total=len(leads)
         )
         
+    except AdmissionRejectedError as e:
+        raise admission_rejected(e)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -121,46 +170,29 @@ async def scrape_leads_apollo(
         )
 
 @router.post("/scrape-leads-yellowpages", response_model=SearchResponse)
-async def scrape_leads_yellowpages(request: SearchRequest):
+async def scrape_leads_yellowpages(
+    request: SearchRequest,
+    max_pages: int = Query(default=1, ge=1, le=5, description="Maximum pages to scrape (1-5)")
+):
     try:
         # Scrape Companies From Yellow Pages
         scraped_companies = await scrape_yellow_pages_companies(
             industry=request.industry,
-            location=request.location
+            location=request.location,
+            max_pages=max_pages
         )
         
-        # Transform Scraped Data to Lead Format
-        leads = []
-        for company_data in scraped_companies:
-            # Create a Mock Structure Similar to Apollo API Response
-            mock_apollo_data = {
-                "organization": {
-                    "name": company_data.get("company", "Unknown Company"),
-                    "industry": company_data.get("industry", "Unknown"),
-                    "city": company_data.get("location", "").split(",")[0].strip() if company_data.get("location") else "",
-                    "state": company_data.get("location", "").split(",")[1].strip() if "," in company_data.get("location", "") else "",
-                    "website_url": company_data.get("website", "N/A"),
-                    "linkedin_url": "N/A",  
-                    "estimated_num_employees": 0
-                },
-                "person": {
-                    "name": "Contact not available",
-                    "email": company_data.get("contact_phone", "")
-                }
-            }
-            
-            lead = DataTransformer.transform_apollo_data_to_lead(mock_apollo_data)
-            # Add Phone Number to Contact Info if Available
-            if company_data.get("contact_phone", "N/A") != "N/A":
-                lead.contact = f"Phone: {company_data.get('contact_phone')}"
-            
-            leads.append(lead)
+        # Normalize Scraped Listings Straight Into Leads
+        leads = normalize_all(scraped_companies, "yellowpages")
+        await lead_store.put_leads(leads)
         
         return SearchResponse(
             leads=leads,
             total=len(leads)
         )
         
+    except AdmissionRejectedError as e:
+        raise admission_rejected(e)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -172,45 +204,85 @@ async def search_leads_hybrid(
     request: SearchRequest,
     use_scraping: bool = Query(default=False, description="Include Web Scraping as Fallback"),
     scrape_source: str = Query(default="yellowpages", description="Scraping Source: 'Apollo' or 'Yellowpages'"),
-    max_scrape_pages: int = Query(default=1, ge=1, le=3, description="Max Pages to Scrape if API Fails")
+    max_scrape_pages: int = Query(default=1, ge=1, le=3, description="Max Pages to Scrape if API Fails"),
+    max_pages: int = Query(default=1, ge=1, le=settings.MAX_SEARCH_PAGES, description="Maximum Apollo Result Pages to Fetch"),
+    max_results: Optional[int] = Query(default=None, ge=1, description="Maximum Number of Leads to Return"),
+    bypass_cache: bool = Query(default=False, description="Skip Cached Apollo Results & Refresh Them"),
+    mode: str = Query(default="fallback", pattern="^(fallback|race)$", description="'fallback': Scrape Only if API Fails; 'race': Run API & Scraper Concurrently and Merge"),
+    deadline: float = Query(default=settings.HYBRID_DEADLINE, gt=0, le=120, description="Global Deadline in Seconds for 'race' Mode"),
+    resolve_contacts: bool = Query(default=False, description="Look Up Ranked Decision-Maker Contacts for Every Organization")
 ):
     leads = []
     api_success = False
+    # Any Spelling of 'Apollo' Scrapes Apollo; Everything Else Scrapes Yellow Pages, Matching the Adapter Keys
+    scrape_source = "apollo" if scrape_source.strip().lower() == "apollo" else "yellowpages"
     
-    # Try Apollo API First
-    if apollo_client:
-        try:
-            apollo_response = await apollo_client.search_companies(
+    # Try Apollo API First, Skipping it Immediately While its Circuit is Open
+    apollo_available = apollo_client is not None and not apollo_client.circuit_breaker.is_open
+    if apollo_client and not apollo_available:
+        logger.info("Hybrid search skipping Apollo API: circuit open")
+    
+    async def fetch_apollo_leads() -> List[Lead]:
+        apollo_response = await apollo_client.search_companies_pages(
+            industry=request.industry,
+            location=request.location,
+            max_pages=max_pages,
+            per_page=settings.MAX_PAGE_SIZE,
+            max_results=max_results,
+            use_cache=not bypass_cache,
+            max_retries=settings.HYBRID_MAX_RETRIES
+        )
+        contacts_by_org = None
+        if resolve_contacts:
+            contacts_by_org = await apollo_client.search_people_for_organizations(
+                [company.get("id") for company in apollo_response.get("organizations", [])],
+                per_organization=settings.CONTACTS_PER_LEAD,
+                use_cache=not bypass_cache,
+                max_retries=settings.HYBRID_MAX_RETRIES
+            )
+        return apollo_response_to_leads(apollo_response, contacts_by_org)
+    
+    async def fetch_scraped_leads() -> List[Lead]:
+        if scrape_source == "apollo":
+            scraped_companies = await scrape_apollo_companies(
                 industry=request.industry,
                 location=request.location,
-                per_page=settings.MAX_PAGE_SIZE
+                max_pages=max_scrape_pages
             )
-            
-            # Process API Response
-            companies = apollo_response.get("organizations", [])
-            people = apollo_response.get("people", [])
-            
-            org_people_map = {}
-            for person in people:
-                org_id = person.get("organization_id")
-                if org_id:
-                    if org_id not in org_people_map:
-                        org_people_map[org_id] = []
-                    org_people_map[org_id].append(person)
-            
-            for company in companies:
-                company_id = company.get("id")
-                associated_people = org_people_map.get(company_id, [{}])
-                primary_person = associated_people[0] if associated_people else {}
-                
-                combined_data = {
-                    "organization": company,
-                    "person": primary_person
-                }
-                
-                lead = DataTransformer.transform_apollo_data_to_lead(combined_data)
-                leads.append(lead)
-            
+        else:  
+            scraped_companies = await scrape_yellow_pages_companies(
+                industry=request.industry,
+                location=request.location,
+                max_pages=max_scrape_pages
+            )
+        return normalize_all(scraped_companies, scrape_source)
+    
+    # Race Mode: Start Both Sources Together & Keep Whatever Finishes Before the Deadline
+    if mode == "race":
+        sources = {scrape_source: fetch_scraped_leads}
+        if apollo_available:
+            sources = {"apollo_api": fetch_apollo_leads, **sources}
+        results, timings = await run_sources_with_deadline(sources, deadline)
+        if apollo_client and not apollo_available:
+            timings.insert(0, SourceTiming(source="apollo_api", status="skipped", elapsed_ms=0, error="Circuit Open"))
+        
+        leads = await lead_deduplicator.dedupe_async(results)
+        if not leads and not any(timing.status == "ok" for timing in timings):
+            raise HTTPException(
+                status_code=504 if any(timing.status == "timeout" for timing in timings) else 500,
+                detail=f"No Source Returned Results: {'; '.join(f'{t.source}: {t.error or t.status}' for t in timings)}"
+            )
+        await lead_store.put_leads(leads)
+        
+        return SearchResponse(
+            leads=leads,
+            total=len(leads),
+            sources=timings
+        )
+    
+    if apollo_available:
+        try:
+            leads = await fetch_apollo_leads()
             api_success = True
             
         except Exception as e:
@@ -220,42 +292,11 @@ async def search_leads_hybrid(
     # Fallback to Scraping if API Failed and Scraping is Enabled
     if not api_success and use_scraping:
         try:
-            if scrape_source == "apollo":
-                scraped_companies = await scrape_apollo_companies(
-                    industry=request.industry,
-                    location=request.location,
-                    max_pages=max_scrape_pages
-                )
-            else:  
-                scraped_companies = await scrape_yellow_pages_companies(
-                    industry=request.industry,
-                    location=request.location
-                )
-            
-            for company_data in scraped_companies:
-                mock_apollo_data = {
-                    "organization": {
-                        "name": company_data.get("company", "Unknown Company"),
-                        "industry": company_data.get("industry", "Unknown"),
-                        "city": company_data.get("location", "").split(",")[0].strip() if company_data.get("location") else "",
-                        "state": company_data.get("location", "").split(",")[1].strip() if "," in company_data.get("location", "") else "",
-                        "website_url": company_data.get("website", "N/A"),
-                        "linkedin_url": company_data.get("linkedin_url", "N/A"),
-                        "estimated_num_employees": 0
-                    },
-                    "person": {
-                        "name": "Contact not available", 
-                        "email": company_data.get("contact_phone", "") if scrape_source == "yellowpages" else ""
-                    }
-                }
-                
-                lead = DataTransformer.transform_apollo_data_to_lead(mock_apollo_data)
-                # Add Phone for Yellow Pages Results
-                if scrape_source == "yellowpages" and company_data.get("contact_phone", "N/A") != "N/A":
-                    lead.contact = f"Phone: {company_data.get('contact_phone')}"
-                
-                leads.append(lead)
+            leads.extend(await fetch_scraped_leads())
                 
+        except AdmissionRejectedError as e:
+            if not leads:
+                raise admission_rejected(e)
         except Exception as e:
             if not leads:
                 raise HTTPException(
@@ -269,27 +310,116 @@ async def search_leads_hybrid(
             detail="Apollo API Not Configured & Scraping Disabled. Please Set APOLLO_API_KEY or Enable Scraping."
         )
     
+    # Listings Often Repeat Within a Source Too
+    leads = await lead_deduplicator.dedupe_async({"apollo_api" if api_success else scrape_source: leads})
+    await lead_store.put_leads(leads)
+    
     return SearchResponse(
         leads=leads,
         total=len(leads)
     )
 
-@router.get("/leads", response_model=List[Lead])
-async def get_all_leads():
-    # Get All Stored Leads for Outreach Message Generation
+@router.post("/jobs/scrape", response_model=ScrapeJob, status_code=202)
+async def create_scrape_job(request: ScrapeJobRequest):
+    # Queue a Scrape to Run in the Background & Return its Job ID Immediately
+    try:
+        return job_manager.submit(request)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "30"})
+
+@router.get("/jobs/{job_id}", response_model=ScrapeJob)
+async def get_scrape_job(
+    job_id: str,
+    include_leads: bool = Query(default=False, description="Include Leads Found So Far (Available Before the Job Finishes)")
+):
+    # Get Job Status, Progress & Optionally its (Partial) Results
+    job = job_manager.get(job_id, include_leads=include_leads)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job Not Found")
+    return job
+
+@router.get("/jobs/{job_id}/events")
+async def stream_scrape_job(job_id: str):
+    # Stream Job Progress as Server-Sent Events Until the Job Finishes
+    if not job_manager.get(job_id):
+        raise HTTPException(status_code=404, detail="Job Not Found")
+    
+    async def progress_events() -> AsyncIterator[str]:
+        async for job in job_manager.events(job_id):
+            if job is None:
+                yield ": keep-alive\n\n"
+                continue
+            event = "done" if job.status in (JobStatus.COMPLETED, JobStatus.FAILED) else "progress"
+            yield f"event: {event}\ndata: {job.model_dump_json(exclude={'leads'})}\n\n"
+    
+    return StreamingResponse(progress_events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@router.get("/leads", response_model=LeadPage)
+async def get_all_leads(
+    limit: int = Query(default=50, ge=1, le=settings.LEADS_PAGE_MAX, description="Leads per Page"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor From the Previous Page"),
+    industry: Optional[str] = Query(default=None, description="Exact Industry (Case-Insensitive)"),
+    location: Optional[str] = Query(default=None, description="Exact Location (Case-Insensitive)"),
+    priority: Optional[str] = Query(default=None, description="Low, Medium or High"),
+    domain: Optional[str] = Query(default=None, description="Website Domain or URL, e.g. acme.com"),
+    updated_since: Optional[datetime] = Query(default=None, description="Only Leads Stored at or After This Time (ISO 8601)"),
+    fields: Optional[str] = Query(default=None, description="Comma-Separated Lead Fields to Return; id is Always Included")
+):
+    # Page Through Stored Leads, Newest First, for Outreach Message Generation
+    projection = None
+    if fields:
+        projection = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in projection if field not in Lead.model_fields]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown Lead Field(s): {', '.join(unknown)}")
+    
     try:
-        return list(leads_storage.values())
+        leads, next_seq = await lead_store.query_leads(
+            limit=limit,
+            before_seq=decode_cursor(cursor) if cursor else None,
+            industry=industry,
+            location=location,
+            priority=priority,
+            domain=domain,
+            updated_since=updated_since.timestamp() if updated_since else None,
+            fields=projection
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to Retrieve Leads: {str(e)}")
+    
+    return LeadPage(leads=leads, next_cursor=encode_cursor(next_seq) if next_seq is not None else None, limit=limit)
+
+@router.get("/search", response_model=TextSearchResponse)
+async def search_stored(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to Find; the Last Word Also Matches as a Prefix"),
+    kind: Optional[str] = Query(default=None, pattern="^(lead|message)$", description="Only 'lead' or Only 'message' Hits"),
+    limit: int = Query(default=20, ge=1, le=100, description="Hits per Page"),
+    offset: int = Query(default=0, ge=0, le=1000, description="Hits to Skip")
+):
+    # Ranked Full-Text Search Over Stored Company Names, Industries, Outreach Angles & Generated Messages
+    try:
+        hits, has_more = await lead_store.search(q, limit=limit, offset=offset, kind=kind)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Search Failed: {str(e)}")
+    return TextSearchResponse(query=q, hits=hits, next_offset=offset + limit if has_more else None)
 
 @router.get("/leads/{lead_id}", response_model=Lead)
 async def get_lead(lead_id: str):
     # Get a Specific Lead by ID
-    lead = leads_storage.get(lead_id)
+    lead = await lead_store.get_lead(lead_id)
     if not lead:
         raise HTTPException(status_code=404, detail="Lead Not Found")
     return lead
 
+@router.post("/leads/enrich", response_model=List[Lead])
+async def enrich_leads(leads: List[Lead]):
+    # Crawl Each Lead's Website for Emails, Phone Numbers & Social Links
+    enriched = await enrichment_service.enrich_leads(leads)
+    await lead_store.put_leads(enriched)
+    return enriched
+
 @router.post("/export-leads")
 async def export_leads(leads: List[Lead]):
     # Export Selected Leads to CSV Format
@@ -303,7 +433,21 @@ async def health_check():
     return HealthResponse(
         status="healthy",
         apollo_api=apollo_status,
-        timestamp=datetime.now().isoformat()
+        timestamp=datetime.now().isoformat(),
+        apollo_circuit=apollo_client.circuit_breaker.state if apollo_client else None,
+        search_cache=search_cache.stats() if search_cache else None,
+        apollo_client=apollo_client.stats() if apollo_client else None,
+        browser_pool=browser_pool.stats(),
+        scraping={
+            "page_loads": scrape_metrics.stats(),
+            "hosts": host_scheduler.stats()
+        },
+        jobs=job_manager.stats(),
+        scrape_admission=scrape_admission.stats(),
+        enrichment=enrichment_service.stats(),
+        normalization=pipeline_metrics.stats(),
+        dedup=lead_deduplicator.stats(),
+        lead_store=lead_store.stats()
     )
 
 @router.post("/outreach/generate", response_model=OutreachResponse)
@@ -311,7 +455,7 @@ async def generate_outreach_message(
     request: OutreachRequest = Body(...),
     lead_id: Optional[str] = None
 ):
-    lead = await get_lead_by_id(lead_id) if lead_id else None
+    lead = await lead_store.get_lead(lead_id) if lead_id else None
 
     if not lead and getattr(request, "lead", None):
         lead = request.lead
@@ -323,7 +467,6 @@ async def generate_outreach_message(
     try:
         message = await ai_outreach_service.generate_outreach_message(lead, request)
         message.id = str(uuid.uuid4())
-        store_message(message)
 
         analysis = None
         try:
@@ -335,6 +478,7 @@ async def generate_outreach_message(
             message.quality_score = analysis.overall_score
         except Exception as e:
             print(f"Failed to Analyze Message Quality: {e}")
+        await lead_store.put_message(message)
 
         return OutreachResponse(
             message=message,
@@ -355,7 +499,7 @@ async def generate_bulk_outreach_messages(request: BulkOutreachRequest):
         
         for lead_id in request.lead_ids:
             try:
-                lead = await get_lead_by_id(lead_id) 
+                lead = await lead_store.get_lead(lead_id)
                 if lead:
                     leads.append(lead)
                 else:
@@ -372,6 +516,7 @@ async def generate_bulk_outreach_messages(request: BulkOutreachRequest):
         # Assign IDs and Analyze Quality
         for message in messages:
             message.id = str(uuid.uuid4())
+        await lead_store.put_messages(messages)
         
         success_count = len([m for m in messages if m.message])
         failed_count = len(messages) - success_count
@@ -392,7 +537,7 @@ async def generate_bulk_outreach_messages(request: BulkOutreachRequest):
 async def analyze_message_quality(message_id: str):
     # Analyze the Quality of a Generated Message
     try:
-        message = await get_message_by_id(message_id)  
+        message = await lead_store.get_message(message_id)
         
         if not message:
             raise HTTPException(status_code=404, detail="Message Not Found")
@@ -455,23 +600,99 @@ async def get_message_templates():
         ]
     }
 
-leads_storage: dict = {} 
-messages_storage: dict = {}  
-
 # Helper Functions
-async def get_lead_by_id(lead_id: str) -> Optional[Lead]:
-    # Fetch Lead from In-Memory Storage by ID
-    return leads_storage.get(lead_id)
-
-async def get_message_by_id(message_id: str):
-    # Fetch Message from In-Memory Storage by ID
-    return messages_storage.get(message_id)
-
-def store_lead(lead: Lead) -> None:
-    # Store Lead in Memory 
-    leads_storage[lead.id] = lead
-
-def store_message(message) -> None:
-    # Store Message in Memory
-    if message.id:
-        messages_storage[message.id] = message
\ No newline at end of file
+def apollo_response_to_leads(
+    apollo_response: dict,
+    contacts_by_org: Optional[Dict[str, List[dict]]] = None
+) -> List[Lead]:
+    # Transform an Apollo Search Response Into Leads, One per Organization
+    companies = apollo_response.get("organizations", [])
+    people = apollo_response.get("people", [])
+    
+    # Create a Mapping of Organization ID to People
+    org_people_map = {}
+    for person in people:
+        org_id = person.get("organization_id")
+        if org_id:
+            if org_id not in org_people_map:
+                org_people_map[org_id] = []
+            org_people_map[org_id].append(person)
+    
+    # Use the First Person as the Primary Contact Unless Ranked Contacts Were Resolved
+    records = []
+    for company in companies:
+        associated_people = org_people_map.get(company.get("id"), [{}])
+        contacts = None
+        if contacts_by_org is not None:
+            contacts = DataTransformer.rank_contacts(contacts_by_org.get(company.get("id"), []), settings.CONTACTS_PER_LEAD)
+            if contacts:
+                associated_people = [{"name": contacts[0].name, "email": contacts[0].email}]
+        records.append({"organization": company, "person": associated_people[0] if associated_people else {}, "contacts": contacts})
+    
+    leads = normalize_all(records, "apollo_api")
+    
+    return leads
+
+# Source Tasks Cancelled at a Deadline That Have Not Finished Unwinding Yet
+abandoned_sources: Set[asyncio.Task] = set()
+
+async def run_sources_with_deadline(
+    sources: Dict[str, Callable[[], Awaitable[List[Lead]]]],
+    deadline: float
+) -> Tuple[Dict[str, List[Lead]], List[SourceTiming]]:
+    # Run Lead Sources Concurrently; Sources Still Running at the Deadline are Cancelled
+    started_at = time.perf_counter()
+    
+    def elapsed_ms() -> float:
+        return round((time.perf_counter() - started_at) * 1000, 1)
+    
+    async def run(name: str, factory: Callable[[], Awaitable[List[Lead]]]) -> Tuple[List[Lead], SourceTiming]:
+        try:
+            source_leads = await factory()
+            return source_leads, SourceTiming(source=name, status="ok", elapsed_ms=elapsed_ms(), count=len(source_leads))
+        except Exception as e:
+            return [], SourceTiming(source=name, status="error", elapsed_ms=elapsed_ms(), error=str(e))
+    
+    tasks = {name: asyncio.create_task(run(name, factory)) for name, factory in sources.items()}
+    await asyncio.wait(tasks.values(), timeout=deadline)
+    
+    results, timings = {}, []
+    pending = []
+    for name, task in tasks.items():
+        if task.done():
+            source_leads, timing = task.result()
+            results[name] = source_leads
+            timings.append(timing)
+        else:
+            task.cancel()
+            pending.append(task)
+            timings.append(SourceTiming(source=name, status="timeout", elapsed_ms=elapsed_ms(), error=f"Exceeded {deadline}s Deadline"))
+    
+    # Cancelled Sources Release Their Admission Slots & Browser Contexts in the Background; the
+    # Response Does Not Wait, Holding a Reference Only Keeps the Unwinding Tasks From Being Collected
+    for task in pending:
+        abandoned_sources.add(task)
+        task.add_done_callback(abandoned_sources.discard)
+    
+    return results, timings
+
+def encode_cursor(seq: int) -> str:
+    # Opaque Keyset Cursor: the Store Position of the Last Lead on the Page
+    return base64.urlsafe_b64encode(json.dumps({"seq": seq}).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        seq = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))["seq"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid Cursor")
+    if not isinstance(seq, int):
+        raise ValueError("Invalid Cursor")
+    return seq
+
+def admission_rejected(error: AdmissionRejectedError) -> HTTPException:
+    # Translate a Shed Scrape Into a Fast 429 With a Retry-After Hint
+    return HTTPException(
+        status_code=429,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after)}
+    )
@@ -0,0 +1,150 @@
+import argparse
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+from core.config import settings
+from services.browser_pool import browser_pool
+from services.http_client import http_client
+from services.scraper_service import APOLLO_SOURCE, apollo_search_url, yellow_pages_url
+
+# Recorded Pages Live Under fixtures/<source>/page-<n>.html
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SOURCES = ("yellowpages", "apollo")
+
+# Replayed Path per Source; Mirrors yellow_pages_url() & apollo_search_url()
+SOURCE_PATHS = {
+    "/search": "yellowpages",
+    "/companies/search": "apollo"
+}
+
+def fixture_path(source: str, page_num: int, fixtures_dir: Path = FIXTURES_DIR) -> Path:
+    return fixtures_dir / source / f"page-{page_num}.html"
+
+def load_fixtures(fixtures_dir: Path = FIXTURES_DIR) -> Dict[str, List[bytes]]:
+    # Every Recorded Page per Source, Ordered by Page Number
+    fixtures: Dict[str, List[bytes]] = {}
+    for source in SOURCES:
+        files = sorted((fixtures_dir / source).glob("page-*.html"), key=lambda path: int(path.stem.split("-")[1]))
+        fixtures[source] = [path.read_bytes() for path in files]
+    return fixtures
+
+def synthesize_fixtures(pages: int = 3, cards_per_page: int = 30) -> Dict[str, List[bytes]]:
+    # Deterministic Stand-In Pages Matching the Declarative Card Selectors; Used When Nothing Was Recorded
+    yellow_pages, apollo_pages = [], []
+    for page_num in range(1, pages + 1):
+        yellow_cards, apollo_cards = [], []
+        for index in range(cards_per_page):
+            company_id = (page_num - 1) * cards_per_page + index
+            yellow_cards.append(
+                f'<div class="result"><div class="v-card"><div class="info">'
+                f'<h2 class="n"><a class="business-name" href="/biz/{company_id}"><span>Company {company_id}</span></a></h2>'
+                f'<div class="phones phone primary">(555) 010-{company_id % 10000:04d}</div>'
+                f'<div class="adr"><div class="street-address">{company_id} Main St</div>'
+                f'<div class="locality">Springfield, IL 62701</div></div>'
+                f'<div class="links"><a class="track-visit-website" href="https://company{company_id}.example.com">Website</a></div>'
+                f'</div></div></div>'
+            )
+            apollo_cards.append(
+                f'<div data-testid="company-card"><h3>Company {company_id}</h3>'
+                f'<span class="industry">Software</span><span class="location">Springfield, IL</span>'
+                f'<a class="website-link" href="https://company{company_id}.example.com">Website</a>'
+                f'<a href="https://www.linkedin.com/company/company{company_id}">LinkedIn</a></div>'
+            )
+        yellow_pages.append(
+            f'<html><head><title>Results</title></head><body>'
+            f'<div class="search-results organic">{"".join(yellow_cards)}</div></body></html>'.encode()
+        )
+        apollo_pages.append(
+            f'<html><head><title>Companies</title></head><body>'
+            f'<div class="companies">{"".join(apollo_cards)}</div></body></html>'.encode()
+        )
+    return {"yellowpages": yellow_pages, "apollo": apollo_pages}
+
+class ReplayServer:
+    # Local HTTP Server Answering Scraper URLs With Recorded Pages: page=N Serves Fixture N (Wrapping Around)
+    def __init__(self, fixtures: Dict[str, List[bytes]], host: str = "127.0.0.1", port: int = 0):
+        self.fixtures = fixtures
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                pages = server.fixtures.get(SOURCE_PATHS.get(parsed.path, ""), [])
+                if not pages:
+                    self.send_error(404)
+                    return
+                page_num = int(parse_qs(parsed.query).get("page", ["1"])[0])
+                body = pages[(page_num - 1) % len(pages)]
+                server.requests += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def point_scrapers_here(self) -> None:
+        # Redirect Both Scrapers to This Server for the Rest of the Process
+        settings.YELLOW_PAGES_BASE_URL = self.base_url
+        settings.APOLLO_BASE_URL = self.base_url
+
+async def record_fixtures(industry: str, location: str, pages: int, fixtures_dir: Path = FIXTURES_DIR) -> None:
+    # Save Live Result Pages: Yellow Pages is Plain HTML, Apollo is Captured After its Cards Render
+    client = await http_client.get_client()
+    for page_num in range(1, pages + 1):
+        response = await client.get(yellow_pages_url(industry, location, page_num))
+        response.raise_for_status()
+        path = fixture_path("yellowpages", page_num, fixtures_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(response.text, encoding="utf-8")
+        print(f"Recorded {path}")
+
+    await browser_pool.start()
+    try:
+        for page_num in range(1, pages + 1):
+            async with browser_pool.context() as pooled:
+                page = await pooled.new_page()
+                await page.goto(apollo_search_url(industry, location, page_num), wait_until="domcontentloaded")
+                try:
+                    await page.wait_for_selector(APOLLO_SOURCE["card"], timeout=10000)
+                except Exception as e:
+                    print(f"Apollo page {page_num} rendered no company cards (login required?): {str(e)}")
+                path = fixture_path("apollo", page_num, fixtures_dir)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(await page.content(), encoding="utf-8")
+                print(f"Recorded {path}")
+    finally:
+        await browser_pool.close()
+        await http_client.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record Yellow Pages & Apollo result pages for offline benchmarks")
+    parser.add_argument("industry")
+    parser.add_argument("location")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--out", type=Path, default=FIXTURES_DIR)
+    args = parser.parse_args()
+    asyncio.run(record_fixtures(args.industry, args.location, args.pages, args.out))
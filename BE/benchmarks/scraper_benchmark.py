@@ -0,0 +1,143 @@
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+from core.config import settings
+from benchmarks.fixtures import FIXTURES_DIR, ReplayServer, load_fixtures, synthesize_fixtures
+
+# Mode -> (Source, Static First, Lean Mode); Static Mode Only Exists for Yellow Pages
+MODES: Dict[str, tuple] = {
+    "yellowpages-static": ("yellowpages", True, True),
+    "yellowpages-browser-full": ("yellowpages", False, False),
+    "yellowpages-browser-lean": ("yellowpages", False, True),
+    "apollo-browser-full": ("apollo", False, False),
+    "apollo-browser-lean": ("apollo", False, True)
+}
+
+def peak_rss_mb(child_baseline: int = 0) -> Dict[str, float]:
+    # ru_maxrss is KiB on Linux; Children Covers the Playwright Driver & Chromium Once They Have Exited
+    child_peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return {
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "peak_child_rss_mb": round(child_peak / 1024, 1) if child_peak > child_baseline else 0.0
+    }
+
+async def run_mode(mode: str, pages: int, rounds: int, warmup: int, fixtures_dir: Path) -> Dict[str, Any]:
+    # Scrape the Replay Server `rounds` Times in One Mode & Report Throughput
+    from services.browser_pool import browser_pool
+    from services.host_scheduler import host_scheduler
+    from services.http_client import http_client
+    from services.scraper_service import ScraperService
+
+    source, static_first, lean = MODES[mode]
+    child_baseline = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    settings.YELLOW_PAGES_STATIC_FIRST = static_first
+    settings.SCRAPING_LEAN_MODE = lean
+    settings.SCRAPING_LEAN_BASELINE_SAMPLE_RATE = 0.0
+
+    fixtures = load_fixtures(fixtures_dir)
+    if not fixtures.get(source):
+        fixtures = synthesize_fixtures()
+    server = ReplayServer(fixtures).start()
+    server.point_scrapers_here()
+    # The Replay Server is Local: Politeness Delays Would Only Measure the Scheduler
+    host_scheduler.configure("127.0.0.1", min_interval=0.0, max_in_flight=settings.SEARCH_PAGE_CONCURRENCY)
+
+    scraper = ScraperService()
+    result: Dict[str, Any] = {"mode": mode, "pages": pages, "rounds": rounds, "fixtures": len(fixtures[source])}
+    try:
+        if source == "apollo" or not static_first:
+            await browser_pool.start()
+
+        async def scrape() -> List[Dict[str, Any]]:
+            if source == "apollo":
+                return await scraper.scrape_apollo_companies("software", "springfield", pages)
+            return await scraper.scrape_yellow_pages("software", "springfield", pages)
+
+        for _ in range(warmup):
+            await scrape()
+
+        cards = 0
+        started = time.perf_counter()
+        for _ in range(rounds):
+            cards += len(await scrape())
+        elapsed = time.perf_counter() - started
+
+        result.update({
+            "cards": cards,
+            "cards_per_second": round(cards / elapsed, 1) if elapsed else 0.0,
+            "ms_per_page": round(elapsed * 1000 / (pages * rounds), 2),
+            "elapsed_seconds": round(elapsed, 3)
+        })
+        if cards == 0:
+            result["error"] = "No cards scraped"
+    except Exception as e:
+        result["error"] = str(e).splitlines()[0]
+    finally:
+        await browser_pool.close()
+        await http_client.close()
+        server.close()
+
+    result.update(peak_rss_mb(child_baseline))
+    return result
+
+def run_isolated(mode: str, args: argparse.Namespace) -> Dict[str, Any]:
+    # One Process per Mode so Peak RSS is Not Inherited From the Previous Mode
+    completed = subprocess.run(
+        [
+            sys.executable, "-m", "benchmarks.scraper_benchmark", "--child", "--modes", mode,
+            "--pages", str(args.pages), "--rounds", str(args.rounds), "--warmup", str(args.warmup),
+            "--fixtures", str(args.fixtures)
+        ],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0 or not completed.stdout.strip():
+        return {"mode": mode, "error": completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "Benchmark process failed"}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    header = f"{'mode':<26}{'cards/s':>10}{'ms/page':>10}{'peak RSS MB':>13}{'child RSS MB':>14}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        if result.get("error"):
+            print(f"{result['mode']:<26}  skipped: {result['error']}")
+            continue
+        print(
+            f"{result['mode']:<26}{result['cards_per_second']:>10}{result['ms_per_page']:>10}"
+            f"{result['peak_rss_mb']:>13}{result['peak_child_rss_mb']:>14}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline ScraperService benchmark against recorded fixtures")
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated modes: " + ", ".join(MODES))
+    parser.add_argument("--pages", type=int, default=5, help="Result pages per scrape")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed scrapes per mode")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed scrapes per mode")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR, help="Recorded fixtures; synthetic pages are used if empty")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        parser.error(f"Unknown mode(s): {', '.join(unknown)}")
+
+    if args.child:
+        logging.disable(logging.WARNING)
+        print(json.dumps(asyncio.run(run_mode(modes[0], args.pages, args.rounds, args.warmup, args.fixtures))))
+    else:
+        results = [run_isolated(mode, args) for mode in modes]
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_table(results)
@@ -0,0 +1,59 @@
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+from services.source_adapters import normalize, normalize_all
+
+INDUSTRIES = ["Technology", "Healthcare", "Finance", "Manufacturing", "Retail", "Education", "Hospitality", "Construction"]
+
+def synthesize_page(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    # Apollo-Shaped Organization Records
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"org-{index}",
+            "name": f"Company {index}",
+            "industry": rng.choice(INDUSTRIES),
+            "city": "Springfield",
+            "state": "IL",
+            "website_url": f"https://company{index}.example.com",
+            "linkedin_url": f"https://www.linkedin.com/company/company{index}",
+            "estimated_num_employees": rng.randint(0, 1000),
+            "primary_phone": {"number": f"+1 555 010 {index % 10000:04d}"} if index % 3 else {}
+        }
+        for index in range(count)
+    ]
+
+def per_record(organizations: List[Dict[str, Any]]) -> list:
+    return list(normalize(({"organization": org, "person": {}} for org in organizations), "apollo_api"))
+
+def batch(organizations: List[Dict[str, Any]]) -> list:
+    return normalize_all(({"organization": org, "person": {}} for org in organizations), "apollo_api")
+
+def best_of(function, organizations: List[Dict[str, Any]], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(organizations)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-record vs batch Apollo-to-Lead normalization")
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    organizations = synthesize_page(args.records)
+    baseline = best_of(per_record, organizations, args.repeat)
+    batched = best_of(batch, organizations, args.repeat)
+
+    # Both Paths Must Produce the Same Leads Apart From Their Random IDs
+    expected = [lead.model_dump(exclude={"id"}) for lead in per_record(organizations[:100])]
+    actual = [lead.model_dump(exclude={"id"}) for lead in batch(organizations[:100])]
+    assert expected == actual, "normalize_all output differs from normalize"
+
+    print(f"records:        {args.records}")
+    print(f"per-record:     {baseline * 1000:.1f} ms ({args.records / baseline:,.0f} records/s)")
+    print(f"normalize_all:  {batched * 1000:.1f} ms ({args.records / batched:,.0f} records/s)")
+    print(f"speedup:        {baseline / batched:.1f}x")
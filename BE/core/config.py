@@ -9,7 +9,7 @@ class Settings:
     # Apollo API Configuration
     APOLLO_API_KEY: str = os.getenv("APOLLO_API_KEY", "")
     APOLLO_API_URL: str = "https://api.apollo.io/v1"
-    APOLLO_BASE_URL: str = "https://app.apollo.io"
+    APOLLO_BASE_URL: str = os.getenv("APOLLO_BASE_URL", "https://app.apollo.io").rstrip("/")
 
     # AI/Gemini Configuration
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
@@ -43,12 +43,81 @@ class Settings:
     DEFAULT_PAGE_SIZE: int = 25
     MAX_PAGE_SIZE: int = 50
     REQUEST_TIMEOUT: float = 30.0
+    APOLLO_RATE_LIMIT_PER_MINUTE: int = int(os.getenv("APOLLO_RATE_LIMIT_PER_MINUTE", "200"))
+    APOLLO_RATE_LIMIT_BURST: int = int(os.getenv("APOLLO_RATE_LIMIT_BURST", "10"))
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RESET_TIMEOUT: float = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30.0"))
+    HYBRID_DEADLINE: float = float(os.getenv("HYBRID_DEADLINE", "25.0"))
+    MAX_SEARCH_PAGES: int = int(os.getenv("MAX_SEARCH_PAGES", "10"))
+    SEARCH_PAGE_CONCURRENCY: int = int(os.getenv("SEARCH_PAGE_CONCURRENCY", "5"))
+    APOLLO_PEOPLE_CHUNK_SIZE: int = int(os.getenv("APOLLO_PEOPLE_CHUNK_SIZE", "25"))
+    APOLLO_PEOPLE_MAX_ROUNDS: int = int(os.getenv("APOLLO_PEOPLE_MAX_ROUNDS", "3"))  # Requests per Chunk While Organizations Lack Contacts
+    APOLLO_CONTACT_SENIORITIES: List[str] = os.getenv(
+        "APOLLO_CONTACT_SENIORITIES", "owner,founder,c_suite,partner,vp,head,director"
+    ).split(",")
+    CONTACTS_PER_LEAD: int = int(os.getenv("CONTACTS_PER_LEAD", "3"))
+    STREAM_MAX_PAGES: int = int(os.getenv("STREAM_MAX_PAGES", "100"))
+    
+    # HTTP Connection Pool Settings
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30.0"))
+    
+    # Search Cache Settings
+    SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_TTL: float = float(os.getenv("SEARCH_CACHE_TTL", "3600"))
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "512"))
+    SEARCH_CACHE_DB_PATH: str = os.getenv("SEARCH_CACHE_DB_PATH", "")  # Empty Disables the On-Disk Tier
     
     # Scraping Settings
-    SCRAPING_DELAY: float = 1.0  
-    MAX_RETRIES: int = 3
+    SCRAPING_DELAY: float = float(os.getenv("SCRAPING_DELAY", "0.5"))  # Minimum Seconds Between Request Starts per Host
+    SCRAPING_HOST_CONCURRENCY: int = int(os.getenv("SCRAPING_HOST_CONCURRENCY", "3"))
+    # Yellow Pages Origin; Point it (& APOLLO_BASE_URL) at a Local Replay Server for Offline Benchmarks
+    YELLOW_PAGES_BASE_URL: str = os.getenv("YELLOW_PAGES_BASE_URL", "https://www.yellowpages.com").rstrip("/")
+    YELLOW_PAGES_STATIC_FIRST: bool = os.getenv("YELLOW_PAGES_STATIC_FIRST", "true").lower() == "true"
+    SCRAPING_LEAN_MODE: bool = os.getenv("SCRAPING_LEAN_MODE", "true").lower() == "true"
+    SCRAPING_LEAN_MODE_DISABLED_SOURCES: List[str] = [
+        source.strip().lower() for source in os.getenv("SCRAPING_LEAN_MODE_DISABLED_SOURCES", "").split(",") if source.strip()
+    ]
+    # Opt-In: Share of Browser Page Loads Run in Full Mode to Measure What Lean Mode Saves; 0 (Default) Never Loads Full Pages
+    SCRAPING_LEAN_BASELINE_SAMPLE_RATE: float = float(os.getenv("SCRAPING_LEAN_BASELINE_SAMPLE_RATE", "0"))
+    SCRAPE_MAX_CONCURRENT: int = int(os.getenv("SCRAPE_MAX_CONCURRENT", "3"))
+    SCRAPE_MAX_QUEUE: int = int(os.getenv("SCRAPE_MAX_QUEUE", "10"))
+    SCRAPE_QUEUE_TIMEOUT: float = float(os.getenv("SCRAPE_QUEUE_TIMEOUT", "30.0"))
+    BROWSER_POOL_SIZE: int = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+    BROWSER_CONTEXT_MAX_PAGES: int = int(os.getenv("BROWSER_CONTEXT_MAX_PAGES", "20"))
+    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+    RETRY_BACKOFF_BASE: float = float(os.getenv("RETRY_BACKOFF_BASE", "0.5"))
+    RETRY_MAX_WAIT: float = float(os.getenv("RETRY_MAX_WAIT", "30.0"))
+    APOLLO_RETRY_BUDGET: float = float(os.getenv("APOLLO_RETRY_BUDGET", "45.0"))  # Total Seconds for All Attempts of One Apollo Call
+    HYBRID_MAX_RETRIES: int = int(os.getenv("HYBRID_MAX_RETRIES", "1"))  # Fewer Retries so the Scraper Fallback Starts Sooner
     USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     
+    # Lead Store Settings
+    LEAD_STORE_BACKEND: str = os.getenv("LEAD_STORE_BACKEND", "sqlite").lower()  # sqlite or memory
+    LEAD_STORE_DB_PATH: str = os.getenv("LEAD_STORE_DB_PATH", "./data/leads.db")
+    LEADS_PAGE_MAX: int = int(os.getenv("LEADS_PAGE_MAX", "500"))
+
+    # Lead Deduplication Settings
+    DEDUP_NAME_SIMILARITY: float = float(os.getenv("DEDUP_NAME_SIMILARITY", "0.7"))
+
+    # Website Enrichment Settings
+    ENRICHMENT_CONCURRENCY: int = int(os.getenv("ENRICHMENT_CONCURRENCY", "20"))
+    ENRICHMENT_HOST_CONCURRENCY: int = int(os.getenv("ENRICHMENT_HOST_CONCURRENCY", "2"))
+    ENRICHMENT_HOST_MIN_INTERVAL: float = float(os.getenv("ENRICHMENT_HOST_MIN_INTERVAL", "0.25"))
+    ENRICHMENT_HOST_IDLE_TTL: float = float(os.getenv("ENRICHMENT_HOST_IDLE_TTL", "300"))
+    ENRICHMENT_MAX_EXTRA_PAGES: int = int(os.getenv("ENRICHMENT_MAX_EXTRA_PAGES", "2"))
+    ENRICHMENT_TIMEOUT: float = float(os.getenv("ENRICHMENT_TIMEOUT", "10.0"))
+    ENRICHMENT_CACHE_TTL: float = float(os.getenv("ENRICHMENT_CACHE_TTL", "604800"))
+    ENRICHMENT_CACHE_MAX_ENTRIES: int = int(os.getenv("ENRICHMENT_CACHE_MAX_ENTRIES", "10000"))
+    ENRICHMENT_CACHE_DB_PATH: str = os.getenv("ENRICHMENT_CACHE_DB_PATH", "")
+    
+    # Background Job Settings
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_QUEUE_SIZE: int = int(os.getenv("JOB_QUEUE_SIZE", "50"))
+    JOB_RETENTION: int = int(os.getenv("JOB_RETENTION", "200"))
+    
     # File Settings
     EXPORT_DIR: str = os.getenv("EXPORT_DIR", "./exports")
     
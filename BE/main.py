@@ -1,13 +1,48 @@
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from api.routes import router
 from core.config import settings
+from services.apollo_client import apollo_client
+from services.browser_pool import browser_pool
+from services.enrichment_service import enrichment_service
+from services.http_client import http_client
+from services.job_service import job_manager
+from services.lead_store import lead_store
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open Shared Resources on Startup & Release Them on Shutdown
+    if apollo_client:
+        await apollo_client.start()
+    await http_client.start()
+    await lead_store.start()
+    try:
+        await browser_pool.start()
+    except Exception as e:
+        # Scraping Endpoints Retry the Launch on First Use
+        logger.warning(f"Shared Chromium failed to launch at startup: {str(e)}")
+    await job_manager.start()
+    try:
+        yield
+    finally:
+        await job_manager.close()
+        await browser_pool.close()
+        await lead_store.close()
+        await enrichment_service.close()
+        await http_client.close()
+        if apollo_client:
+            await apollo_client.close()
 
 # Create FastAPI App
 app = FastAPI(
     title="B2B Lead Generator API", 
     version="1.0.0",
-    description="API for Generating and Managing B2B Leads Using Apollo.io API Integration"
+    description="API for Generating and Managing B2B Leads Using Apollo.io API Integration",
+    lifespan=lifespan
 )
 
 # CORS Middleware
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
 from enum import Enum
@@ -8,6 +8,23 @@ class SearchRequest(BaseModel):
     industry: str
     location: str
 
+# Decision-Maker Contact Attached to a Lead
+class Contact(BaseModel):
+    name: Optional[str] = None
+    title: Optional[str] = None
+    seniority: Optional[str] = None
+    email: Optional[str] = None
+    linkedinUrl: Optional[str] = None
+
+# One Source Record Folded Into a Deduplicated Lead
+class LeadSourceRecord(BaseModel):
+    source: str
+    leadId: str
+    company: str
+    website: Optional[str] = None
+    contact: Optional[str] = None
+    matchedBy: Optional[str] = None  # None for the Record the Lead Was Built From, Else domain or name
+
 # Lead Data Model
 class Lead(BaseModel):
     id: str
@@ -21,17 +38,88 @@ class Lead(BaseModel):
     priority: Optional[str] = None
     outreachAngle: Optional[str] = None
     lastUpdated: Optional[str] = None
+    emails: Optional[List[str]] = None
+    phones: Optional[List[str]] = None
+    socialLinks: Optional[Dict[str, str]] = None
+    contacts: Optional[List[Contact]] = None
+    sourceRecords: Optional[List[LeadSourceRecord]] = None
+
+# Per-Source Outcome for Multi-Source Searches
+class SourceTiming(BaseModel):
+    source: str
+    status: str  # ok, error, timeout or skipped
+    elapsed_ms: float
+    count: int = 0
+    error: Optional[str] = None
 
 # Response Model for Lead Search
 class SearchResponse(BaseModel):
     leads: List[Lead]
     total: int
+    sources: Optional[List[SourceTiming]] = None
+
+# One Page of Stored Leads; Pass next_cursor Back as `cursor` to Get the Following Page
+class LeadPage(BaseModel):
+    leads: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+    limit: int
+
+# Full-Text Search Results Over Stored Leads & Outreach Messages
+class SearchHit(BaseModel):
+    kind: str  # lead or message
+    id: str
+    lead_id: str
+    company: Optional[str] = None
+    score: float
+    snippet: Optional[str] = None
+
+class TextSearchResponse(BaseModel):
+    query: str
+    hits: List[SearchHit]
+    next_offset: Optional[int] = None
+
+# Background Scrape Job Models
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class ScrapeJobRequest(BaseModel):
+    industry: str
+    location: str
+    source: str = Field(default="yellowpages", pattern="^(yellowpages|apollo)$", description="Scraping source: 'yellowpages' or 'apollo'")
+    max_pages: int = Field(default=1, ge=1, le=10, description="Maximum pages to scrape")
+
+class ScrapeJob(BaseModel):
+    id: str
+    status: JobStatus
+    request: ScrapeJobRequest
+    pages_total: int
+    pages_done: int = 0
+    leads_found: int = 0
+    leads: Optional[List[Lead]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
 
 # Health Check Response Model
 class HealthResponse(BaseModel):
     status: str
     apollo_api: str
     timestamp: str
+    apollo_circuit: Optional[str] = None
+    search_cache: Optional[Dict[str, Any]] = None
+    apollo_client: Optional[Dict[str, Any]] = None
+    browser_pool: Optional[Dict[str, Any]] = None
+    scraping: Optional[Dict[str, Any]] = None
+    jobs: Optional[Dict[str, Any]] = None
+    scrape_admission: Optional[Dict[str, Any]] = None
+    enrichment: Optional[Dict[str, Any]] = None
+    normalization: Optional[Dict[str, Any]] = None
+    dedup: Optional[Dict[str, Any]] = None
+    lead_store: Optional[Dict[str, Any]] = None
 
 # Outreach Message Enums
 class MessageType(str, Enum):
@@ -0,0 +1,83 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any
+from core.config import settings
+
+class AdmissionRejectedError(Exception):
+    # Raised When Work is Shed Instead of Queued; Carries a Retry-After Hint in Seconds
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class AdmissionController:
+    # Global Cap on Concurrent Browser-Heavy Work With a Bounded Wait Queue
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.avg_service_time = 10.0  # Seconds; EWMA of Observed Scrape Durations
+
+    def retry_after(self) -> int:
+        # Rough Time Until a Slot Frees Up for a New Arrival
+        backlog = self.queued + 1
+        return max(1, math.ceil(self.avg_service_time * backlog / self.max_concurrent))
+
+    @asynccontextmanager
+    async def admit(self, bypass_queue_limit: bool = False) -> AsyncIterator[None]:
+        # Run Immediately if a Slot is Free, Wait in a Bounded Queue Otherwise, or Fail Fast When it is Full
+        if not bypass_queue_limit and self.queued + self.in_flight >= self.max_concurrent + self.max_queue:
+            self.rejected += 1
+            raise AdmissionRejectedError("Too Many Concurrent Scrapes, Please Retry Later", self.retry_after())
+
+        self.queued += 1
+        started_waiting = time.monotonic()
+        try:
+            timeout = None if bypass_queue_limit else self.queue_timeout
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise AdmissionRejectedError("Timed Out Waiting for a Scrape Slot, Please Retry Later", self.retry_after())
+        finally:
+            self.queued -= 1
+
+        waited = time.monotonic() - started_waiting
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        self.admitted += 1
+        self.in_flight += 1
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+            self.avg_service_time = 0.8 * self.avg_service_time + 0.2 * (time.monotonic() - started_at)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "max_concurrent": self.max_concurrent,
+            "queue_depth": self.queued,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "avg_wait_seconds": round(self.total_wait / self.admitted, 3) if self.admitted else 0.0,
+            "max_wait_seconds": round(self.max_wait, 3),
+            "avg_service_seconds": round(self.avg_service_time, 3)
+        }
+
+# Initialize Shared Admission Controller for Scrapes
+scrape_admission = AdmissionController(
+    max_concurrent=settings.SCRAPE_MAX_CONCURRENT,
+    max_queue=settings.SCRAPE_MAX_QUEUE,
+    queue_timeout=settings.SCRAPE_QUEUE_TIMEOUT
+)
@@ -1,22 +1,83 @@
+import asyncio
+import logging
+import math
+import time
 import httpx
 from fastapi import HTTPException
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, List, Optional, Set
 from core.config import settings
 from core.constants import industry_keywords
+from services.search_cache import SearchCache, search_cache
+from services.single_flight import SingleFlight
+from services.circuit_breaker import CircuitBreaker
+from services.rate_limiter import TokenBucket, parse_retry_after, backoff_delay
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+APOLLO_MAX_PER_PAGE = 100
+
+def person_organization_id(person: Dict[str, Any]) -> Optional[str]:
+    return person.get("organization_id") or (person.get("organization") or {}).get("id")
 
 class ApolloAPIClient:    
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = settings.APOLLO_API_URL
+        self.client: Optional[httpx.AsyncClient] = None
+        self.single_flight = SingleFlight()
+        self.rate_limiter = TokenBucket(
+            rate_per_second=settings.APOLLO_RATE_LIMIT_PER_MINUTE / 60,
+            capacity=settings.APOLLO_RATE_LIMIT_BURST
+        )
+        self.retries = 0
+        self.circuit_breaker = CircuitBreaker(
+            name="apollo",
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.CIRCUIT_RESET_TIMEOUT
+        )
+    
+    async def start(self) -> None:
+        # Open the Shared Keep-Alive Connection Pool to Apollo
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=settings.REQUEST_TIMEOUT,
+                http2=settings.HTTP2_ENABLED,
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY
+                ),
+                headers={
+                    "Cache-Control": "no-cache",
+                    "Content-Type": "application/json",
+                    "X-Api-Key": self.api_key
+                }
+            )
+    
+    async def close(self) -> None:
+        # Close the Shared Connection Pool
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
     
-    async def search_companies(self, industry: str, location: str, page: int = 1, per_page: int = 25) -> Dict[str, Any]:
+    async def get_client(self) -> httpx.AsyncClient:
+        # Return the Shared Client, Opening it Lazily if Used Outside the App Lifespan
+        if self.client is None or self.client.is_closed:
+            await self.start()
+        return self.client
+    
+    async def search_companies(
+        self,
+        industry: str,
+        location: str,
+        page: int = 1,
+        per_page: int = 25,
+        use_cache: bool = True,
+        max_retries: Optional[int] = None
+    ) -> Dict[str, Any]:
         # Search Companies Using Apollo API
-        headers = {
-            "Cache-Control": "no-cache",
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key
-        }
-        
         # Parse Location to Extract City & State/Country
         location_parts = location.split(", ")
         city = location_parts[0] if location_parts else location
@@ -46,25 +107,270 @@ class ApolloAPIClient:
                 ]
             }
         
-        async with httpx.AsyncClient(timeout=settings.REQUEST_TIMEOUT) as client:
+        # Serve Repeated Searches From Cache; Bypassed Calls Still Refresh the Entry
+        cache_key = SearchCache.make_key(payload)
+        if search_cache and use_cache:
+            cached = await search_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Identical Concurrent Searches Share One Upstream Request
+        return await self.single_flight.do(cache_key, lambda: self._post_search(payload, cache_key, max_retries))
+    
+    async def _post_search(self, payload: Dict[str, Any], cache_key: str, max_retries: Optional[int] = None) -> Dict[str, Any]:
+        # Send the Organization Search to Apollo & Store the Response
+        data = await self._post("/organizations/search", payload, max_retries)
+        if search_cache:
+            await search_cache.set(cache_key, data)
+        return data
+    
+    async def _post(self, path: str, payload: Dict[str, Any], max_retries: Optional[int] = None) -> Dict[str, Any]:
+        # Fail Fast While the Circuit is Open, Otherwise Send & Record the Outcome
+        if not self.circuit_breaker.allow_request():
+            raise HTTPException(
+                status_code=503,
+                detail="Apollo API temporarily unavailable (circuit open)",
+                headers={"Retry-After": str(int(self.circuit_breaker.reset_timeout))}
+            )
+        try:
+            data = await self._post_with_retries(path, payload, max_retries)
+        except HTTPException as e:
+            # Client Errors Mean Apollo is Reachable; Exhausted Retries & Server Errors Count as Failures
+            if 400 <= e.status_code < 500 and e.status_code not in RETRYABLE_STATUS_CODES:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+            raise
+        except asyncio.CancelledError:
+            if self.circuit_breaker.state == CircuitBreaker.HALF_OPEN:
+                self.circuit_breaker.record_failure()
+            raise
+        except Exception:
+            # Anything Else (e.g. a Non-JSON Body) Must Still Settle a Half-Open Probe
+            self.circuit_breaker.record_failure()
+            raise
+        self.circuit_breaker.record_success()
+        return data
+    
+    async def _post_with_retries(self, path: str, payload: Dict[str, Any], max_retries: Optional[int] = None) -> Dict[str, Any]:
+        # Rate-Limited POST to Apollo, Retrying 429/5xx & Transport Errors With Jittered Backoff
+        # All Attempts & Waits Share One APOLLO_RETRY_BUDGET, so a Hung Apollo Cannot Stall Callers for MAX_RETRIES Full Timeouts
+        client = await self.get_client()
+        max_retries = settings.MAX_RETRIES if max_retries is None else max_retries
+        deadline = time.monotonic() + settings.APOLLO_RETRY_BUDGET
+        
+        def give_up(attempt: int, delay: float) -> bool:
+            return attempt >= max_retries or time.monotonic() + delay >= deadline
+        
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            timeout = min(settings.REQUEST_TIMEOUT, max(deadline - time.monotonic(), 1.0))
             try:
-                response = await client.post(
-                    f"{self.base_url}/organizations/search",
-                    headers=headers,
-                    json=payload
-                )
+                response = await client.post(path, json=payload, timeout=timeout)
                 response.raise_for_status()
                 return response.json()
             except httpx.HTTPStatusError as e:
-                raise HTTPException(
-                    status_code=e.response.status_code,
-                    detail=f"Apollo API error: {e.response.text}"
+                status_code = e.response.status_code
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+                retryable = status_code in RETRYABLE_STATUS_CODES
+                delay = retry_after if retry_after is not None else backoff_delay(
+                    attempt, settings.RETRY_BACKOFF_BASE, settings.RETRY_MAX_WAIT
                 )
+                if not retryable or delay > settings.RETRY_MAX_WAIT or give_up(attempt, delay):
+                    raise HTTPException(
+                        status_code=status_code,
+                        detail=f"Apollo API error: {e.response.text}"
+                    )
+                logger.warning(f"Apollo returned {status_code}, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
             except httpx.RequestError as e:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Request error: {str(e)}"
-                )
+                delay = backoff_delay(attempt, settings.RETRY_BACKOFF_BASE, settings.RETRY_MAX_WAIT)
+                if give_up(attempt, delay):
+                    raise HTTPException(
+                        status_code=500,
+                        detail=f"Request error: {str(e) or type(e).__name__}"
+                    )
+                logger.warning(f"Apollo request failed ({str(e) or type(e).__name__}), retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def search_people_for_organizations(
+        self,
+        organization_ids: List[str],
+        seniorities: Optional[List[str]] = None,
+        per_organization: int = 3,
+        use_cache: bool = True,
+        max_retries: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        # Resolve People for Many Organizations With Chunked Bulk Searches Sent Concurrently
+        # Apollo Ranks One List per Request, so Chunks are Sized for a 2x Over-Fetch Within One Page
+        organization_ids = list(dict.fromkeys(org_id for org_id in organization_ids if org_id))
+        chunk_size = max(1, min(settings.APOLLO_PEOPLE_CHUNK_SIZE, APOLLO_MAX_PER_PAGE // (per_organization * 2)))
+        chunks = [organization_ids[i:i + chunk_size] for i in range(0, len(organization_ids), chunk_size)]
+        semaphore = asyncio.Semaphore(settings.SEARCH_PAGE_CONCURRENCY)
+        
+        async def fetch_page(chunk: List[str], page: int) -> Dict[str, Any]:
+            payload = {
+                "organization_ids": chunk,
+                "person_seniorities": seniorities or settings.APOLLO_CONTACT_SENIORITIES,
+                "page": page,
+                "per_page": min(APOLLO_MAX_PER_PAGE, len(chunk) * per_organization * 2)
+            }
+            cache_key = SearchCache.make_key({"path": "/mixed_people/search", **payload})
+            if search_cache and use_cache:
+                cached = await search_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            async with semaphore:
+                data = await self.single_flight.do(cache_key, lambda: self._post("/mixed_people/search", payload, max_retries))
+            if search_cache:
+                await search_cache.set(cache_key, data)
+            return data
+        
+        async def fetch_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+            # Re-Query Only the Organizations Still Short so a Large One Cannot Crowd Them Out Again;
+            # Page Forward Only When That Set Stops Shrinking
+            people: List[Dict[str, Any]] = []
+            seen: Set[str] = set()
+            found: Dict[str, int] = {}
+            pending, page = chunk, 1
+            for _ in range(settings.APOLLO_PEOPLE_MAX_ROUNDS):
+                data = await fetch_page(pending, page)
+                for person in data.get("people", []):
+                    person_id = person.get("id")
+                    if person_id in seen:
+                        continue
+                    if person_id:
+                        seen.add(person_id)
+                    people.append(person)
+                    org_id = person_organization_id(person)
+                    found[org_id] = found.get(org_id, 0) + 1
+                short = [org_id for org_id in pending if found.get(org_id, 0) < per_organization]
+                if not short or not data.get("people"):
+                    break
+                if len(short) < len(pending):
+                    pending, page = short, 1
+                elif page < ((data.get("pagination") or {}).get("total_pages") or 1):
+                    page += 1
+                else:
+                    break
+            return people
+        
+        chunk_results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+        
+        people_by_org: Dict[str, List[Dict[str, Any]]] = {}
+        for people in chunk_results:
+            for person in people:
+                org_id = person_organization_id(person)
+                if org_id:
+                    people_by_org.setdefault(org_id, []).append(person)
+        return people_by_org
+    
+    def stats(self) -> Dict[str, Any]:
+        # Report Client-Side Throttling & Resilience Counters
+        return {
+            "rate_limiter": self.rate_limiter.stats(),
+            "retries": self.retries,
+            "single_flight": self.single_flight.stats(),
+            "circuit_breaker": self.circuit_breaker.stats()
+        }
+
+    async def search_companies_pages(
+        self,
+        industry: str,
+        location: str,
+        max_pages: int = 1,
+        per_page: int = 25,
+        max_results: Optional[int] = None,
+        use_cache: bool = True,
+        max_retries: Optional[int] = None
+    ) -> Dict[str, Any]:
+        # Search Several Result Pages & Merge Them Into a Single Apollo-Shaped Response
+        if max_results:
+            max_pages = min(max_pages, math.ceil(max_results / per_page))
+        max_pages = max(1, min(max_pages, settings.MAX_SEARCH_PAGES))
+        
+        # Fetch Page 1 First to Learn How Many Pages Actually Exist
+        first_page = await self.search_companies(industry, location, page=1, per_page=per_page, use_cache=use_cache, max_retries=max_retries)
+        total_pages = first_page.get("pagination", {}).get("total_pages") or 1
+        last_page = min(max_pages, total_pages)
+        
+        # Fetch Remaining Pages Concurrently With Bounded Fan-Out
+        semaphore = asyncio.Semaphore(settings.SEARCH_PAGE_CONCURRENCY)
+        
+        async def fetch_page(page: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.search_companies(industry, location, page=page, per_page=per_page, use_cache=use_cache, max_retries=max_retries)
+        
+        other_pages = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+        responses: List[Dict[str, Any]] = [first_page, *other_pages]
+        
+        organizations = [org for response in responses for org in response.get("organizations", [])]
+        people = [person for response in responses for person in response.get("people", [])]
+        if max_results:
+            organizations = organizations[:max_results]
+        
+        return {
+            "organizations": organizations,
+            "people": people,
+            "pagination": {
+                **first_page.get("pagination", {}),
+                "pages_fetched": len(responses)
+            }
+        }
+
+    async def iter_companies(
+        self,
+        industry: str,
+        location: str,
+        max_pages: int = 1,
+        per_page: int = 25,
+        max_results: Optional[int] = None,
+        use_cache: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        # Yield {"organization", "person"} Records Page by Page, Prefetching the Next Page While the Current One is Consumed
+        if max_results:
+            max_pages = min(max_pages, math.ceil(max_results / per_page))
+        max_pages = max(1, min(max_pages, settings.STREAM_MAX_PAGES))
+        
+        def fetch_page(page: int) -> "asyncio.Task[Dict[str, Any]]":
+            return asyncio.create_task(
+                self.search_companies(industry, location, page=page, per_page=per_page, use_cache=use_cache)
+            )
+        
+        yielded = 0
+        page = 1
+        last_page = max_pages
+        next_task: Optional[asyncio.Task] = fetch_page(1)
+        try:
+            while next_task is not None:
+                response = await next_task
+                if page == 1:
+                    total_pages = response.get("pagination", {}).get("total_pages") or 1
+                    last_page = min(max_pages, total_pages)
+                
+                page += 1
+                next_task = fetch_page(page) if page <= last_page else None
+                
+                # Only One Page of Records is Held at a Time
+                org_people_map: Dict[str, Dict[str, Any]] = {}
+                for person in response.get("people", []):
+                    org_id = person.get("organization_id")
+                    if org_id and org_id not in org_people_map:
+                        org_people_map[org_id] = person
+                
+                for organization in response.get("organizations", []):
+                    yield {
+                        "organization": organization,
+                        "person": org_people_map.get(organization.get("id"), {})
+                    }
+                    yielded += 1
+                    if max_results and yielded >= max_results:
+                        return
+        finally:
+            if next_task is not None and not next_task.done():
+                next_task.cancel()
 
 # Initialize Apollo Client if API Key is Available
 apollo_client = ApolloAPIClient(settings.APOLLO_API_KEY) if settings.is_apollo_configured else None
\ No newline at end of file
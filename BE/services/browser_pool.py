@@ -0,0 +1,159 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, List, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BROWSER_ARGS = ['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage']
+
+class PooledContext:
+    # A Browser Context Leased From the Pool, Counting Pages so it Can be Recycled
+    def __init__(self, context: BrowserContext, generation: int):
+        self.context = context
+        self.generation = generation
+        self.pages_opened = 0
+
+    async def new_page(self) -> Page:
+        self.pages_opened += 1
+        return await self.context.new_page()
+
+class BrowserPool:
+    # One Long-Lived Chromium Handing Out a Bounded Number of Reusable Contexts
+    def __init__(self, max_contexts: int, max_pages_per_context: int):
+        self.max_contexts = max_contexts
+        self.max_pages_per_context = max_pages_per_context
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._generation = 0
+        self._idle: List[PooledContext] = []
+        self._semaphore = asyncio.Semaphore(max_contexts)
+        self._launch_lock = asyncio.Lock()
+        self.restarts = 0
+        self.contexts_created = 0
+        self.contexts_recycled = 0
+
+    async def start(self) -> None:
+        # Launch the Shared Browser (Idempotent)
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            if self._browser is not None:
+                await self._close_browser(self._browser)
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+            self._browser.on("disconnected", lambda _: logger.warning("Shared Chromium disconnected; it will be relaunched on next use"))
+            self._generation += 1
+            self._idle.clear()
+            logger.info(f"Shared Chromium launched (generation {self._generation})")
+
+    async def close(self) -> None:
+        # Close Every Context, the Browser & Playwright
+        async with self._launch_lock:
+            for pooled in self._idle:
+                await self._close_context(pooled)
+            self._idle.clear()
+            if self._browser is not None:
+                try:
+                    await self._browser.close()
+                except Exception as e:
+                    logger.warning(f"Error closing shared Chromium: {str(e)}")
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def _ensure_browser(self) -> Browser:
+        # Relaunch Chromium if it Crashed or Was Never Started
+        if self._browser is None or not self._browser.is_connected():
+            if self._browser is not None:
+                self.restarts += 1
+            await self.start()
+        return self._browser
+
+    async def _close_browser(self, browser: Browser) -> None:
+        # Close a Broken Browser Before Replacing it so its Chromium Process Does Not Leak
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+    async def _discard_browser(self, browser: Browser) -> None:
+        async with self._launch_lock:
+            if self._browser is browser:
+                self._browser = None
+                self.restarts += 1
+        await self._close_browser(browser)
+
+    async def _close_context(self, pooled: PooledContext) -> None:
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+
+    async def _checkout(self) -> PooledContext:
+        browser = await self._ensure_browser()
+        while self._idle:
+            pooled = self._idle.pop()
+            if pooled.generation == self._generation:
+                return pooled
+        try:
+            context = await browser.new_context(user_agent=settings.USER_AGENT)
+        except Exception:
+            # The Browser May Have Died Between the Health Check & Now; Relaunch Once
+            await self._discard_browser(browser)
+            browser = await self._ensure_browser()
+            context = await browser.new_context(user_agent=settings.USER_AGENT)
+        self.contexts_created += 1
+        return PooledContext(context, self._generation)
+
+    async def _checkin(self, pooled: PooledContext, healthy: bool) -> None:
+        # Return a Context for Reuse, or Recycle it Once it Has Served Enough Pages
+        stale = pooled.generation != self._generation or self._browser is None or not self._browser.is_connected()
+        if not healthy or stale or pooled.pages_opened >= self.max_pages_per_context:
+            self.contexts_recycled += 1
+            await self._close_context(pooled)
+            return
+        try:
+            for page in pooled.context.pages:
+                await page.close()
+            await pooled.context.clear_cookies()
+        except Exception:
+            self.contexts_recycled += 1
+            await self._close_context(pooled)
+            return
+        self._idle.append(pooled)
+
+    @asynccontextmanager
+    async def context(self) -> AsyncIterator[PooledContext]:
+        # Lease a Context, Waiting if All Contexts are in Use
+        async with self._semaphore:
+            pooled = await self._checkout()
+            healthy = True
+            try:
+                yield pooled
+            except BaseException:
+                healthy = False
+                raise
+            finally:
+                await self._checkin(pooled, healthy)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "browser_connected": bool(self._browser and self._browser.is_connected()),
+            "generation": self._generation,
+            "max_contexts": self.max_contexts,
+            "idle_contexts": len(self._idle),
+            "contexts_created": self.contexts_created,
+            "contexts_recycled": self.contexts_recycled,
+            "restarts": self.restarts
+        }
+
+# Initialize Shared Browser Pool
+browser_pool = BrowserPool(
+    max_contexts=settings.BROWSER_POOL_SIZE,
+    max_pages_per_context=settings.BROWSER_CONTEXT_MAX_PAGES
+)
@@ -1,7 +1,23 @@
-import uuid
-from datetime import datetime
-from typing import Dict, Any
-from models.schemas import Lead
+import os
+from typing import Dict, Any, List, Optional
+from pydantic import TypeAdapter
+from models.schemas import Contact, Lead
+
+# Validates a Whole List of Leads in One pydantic-core Call
+LEADS_ADAPTER = TypeAdapter(List[Lead])
+
+def batch_uuid4(count: int) -> List[str]:
+    # `count` Random (Version 4) UUID Strings From a Single os.urandom Draw
+    buffer = bytearray(os.urandom(16 * count))
+    for offset in range(0, 16 * count, 16):
+        buffer[offset + 6] = (buffer[offset + 6] & 0x0F) | 0x40
+        buffer[offset + 8] = (buffer[offset + 8] & 0x3F) | 0x80
+    hex_digits = buffer.hex()
+    return [
+        f"{hex_digits[start:start + 8]}-{hex_digits[start + 8:start + 12]}-{hex_digits[start + 12:start + 16]}-"
+        f"{hex_digits[start + 16:start + 20]}-{hex_digits[start + 20:start + 32]}"
+        for start in range(0, 32 * count, 32)
+    ]
 
 class DataTransformer:
     # Service for Transforming Data Between Different Formats
@@ -33,54 +49,38 @@ class DataTransformer:
         
         return "Business growth solutions"
     
+    # Lower Rank = More Senior Decision Maker
+    SENIORITY_RANK = {
+        "owner": 0, "founder": 0, "c_suite": 1, "partner": 2, "vp": 3,
+        "head": 4, "director": 5, "manager": 6, "senior": 7, "entry": 8, "intern": 9
+    }
+    
     @staticmethod
-    def transform_apollo_data_to_lead(company_data: Dict[str, Any]) -> Lead:
-        # Transform Apollo API Company Data to Lead Model
-        
-        # Extract Company Information
-        organization = company_data.get("organization", {})
-        person = company_data.get("person", {})
-        
-        # Get Employee Count
-        employee_count = organization.get("estimated_num_employees", 0)
-        employees_display = str(employee_count) if employee_count else "Unknown"
-        
-        # Determine Priority & Outreach Angle
-        priority = DataTransformer.get_priority_from_employee_count(employee_count)
-        industry = organization.get("industry", "")
-        outreach_angle = DataTransformer.get_outreach_angle_from_industry(industry)
+    def rank_contacts(people: List[Dict[str, Any]], limit: int) -> List[Contact]:
+        # Order People by Seniority, Preferring Those With an Email, & Keep the Top `limit`
+        def sort_key(person: Dict[str, Any]) -> tuple:
+            seniority = (person.get("seniority") or "").lower()
+            has_email = bool(person.get("email")) and "email_not_unlocked" not in (person.get("email") or "")
+            return (DataTransformer.SENIORITY_RANK.get(seniority, len(DataTransformer.SENIORITY_RANK)), not has_email)
         
-        # Get Contact Information
-        primary_phone = organization.get("primary_phone", {})
-        contact_number = primary_phone.get("number", "")
-
-        if contact_number:
-            contact_info = contact_number
-        else:
-            contact_name = person.get("name")
-            contact_email = person.get("email")
-            if contact_name:
-                contact_info = contact_name
-                if contact_email:
-                    contact_info += f" ({contact_email})"
-            else:
-                contact_info = "Contact Not Available"
-        
-        # Format Location
-        city = organization.get("city", "")
-        state = organization.get("state", "")
-        location = f"{city}, {state}".strip(", ")
-        
-        return Lead(
-            id=str(uuid.uuid4()),
-            company=organization.get("name", "Unknown Company"),
-            industry=industry,
-            location=location,
-            website=organization.get("website_url", "N/A"),
-            linkedinUrl=organization.get("linkedin_url", "N/A"),
-            contact=contact_info,
-            employees=employees_display,
-            priority=priority,
-            outreachAngle=outreach_angle,
-            lastUpdated=datetime.now().strftime("%Y-%m-%d")
-        )
+        return [
+            Contact(
+                name=person.get("name") or " ".join(filter(None, [person.get("first_name"), person.get("last_name")])) or None,
+                title=person.get("title"),
+                seniority=person.get("seniority"),
+                email=person.get("email"),
+                linkedinUrl=person.get("linkedin_url")
+            )
+            for person in sorted(people, key=sort_key)[:limit]
+        ]
+    
+    @staticmethod
+    def format_contact(phone_number: Optional[str], person: Dict[str, Any]) -> str:
+        # Organization Phone First, Then "Name (Email)" of the Primary Person
+        if phone_number:
+            return phone_number
+        contact_name = person.get("name")
+        if not contact_name:
+            return "Contact Not Available"
+        contact_email = person.get("email")
+        return f"{contact_name} ({contact_email})" if contact_email else contact_name
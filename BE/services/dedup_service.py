@@ -0,0 +1,197 @@
+import asyncio
+import re
+import zlib
+from typing import Dict, Any, List, Optional, Set, Tuple
+import numpy as np
+from models.schemas import Lead, LeadSourceRecord
+from services.domain_utils import normalize_domain
+from core.config import settings
+
+# Hosts Shared by Many Businesses: a Listing or Social Page Does Not Identify a Company
+SHARED_HOSTS = (
+    "facebook.com", "linkedin.com", "instagram.com", "twitter.com", "x.com", "yelp.com",
+    "yellowpages.com", "google.com", "sites.google.com", "wixsite.com", "godaddysites.com", "business.site"
+)
+
+# Dropped Before Comparing Company Names
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "llp", "ltd", "limited", "co", "corp", "corporation",
+    "company", "plc", "gmbh", "pc", "pllc", "the", "and"
+}
+
+# Values That Count as Missing When Filling a Merged Lead
+PLACEHOLDERS = (None, "", "N/A", "Unknown", "Unknown Company", "Contact Not Available")
+
+# MinHash-LSH Shape: 6 Bands x 5 Rows Puts the Candidate Threshold (1/b)^(1/r) at ~0.7 Jaccard, the Name
+# Cutoff, so Names That Only Share a Common Word ("... Pizza") Rarely Become Candidates
+MINHASH_BANDS = 6
+MINHASH_ROWS = 5
+# A Band Bucket Stops Growing Here, Bounding Each Lookup to bands x MAX_BUCKET_SIZE Comparisons
+MAX_BUCKET_SIZE = 64
+# Small Enough That a * hash + b Stays Within uint64 for Vectorized Hashing
+MERSENNE_PRIME = (1 << 31) - 1
+# Larger Batches are Deduplicated in a Worker Thread Instead of on the Event Loop
+DEDUP_THREAD_THRESHOLD = 500
+
+def dedup_domain(url: Optional[str]) -> Optional[str]:
+    # Normalized Website Domain, or None When Missing or a Shared Host
+    domain = normalize_domain(url)
+    if not domain or any(domain == host or domain.endswith(f".{host}") for host in SHARED_HOSTS):
+        return None
+    return domain
+
+def normalize_company_name(name: Optional[str]) -> str:
+    # Apostrophes are Dropped, Not Spaced, so "Joe's" and "Joes" Compare Equal
+    lowered = re.sub(r"['\u2019]", "", (name or "").lower())
+    tokens = re.sub(r"[^a-z0-9 ]+", " ", lowered.replace("&", " and ")).split()
+    return " ".join(token for token in tokens if token not in LEGAL_SUFFIXES)
+
+def name_shingles(name: str, size: int = 3) -> Set[str]:
+    # Character Shingles of the Normalized Name; Short Names Fall Back to the Whole Name
+    compact = f" {name} "
+    if len(compact) <= size:
+        return {compact}
+    return {compact[index:index + size] for index in range(len(compact) - size + 1)}
+
+def jaccard(left: Set[str], right: Set[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+class MinHashLSH:
+    # Banded MinHash Index: Each Lookup Only Touches Items Sharing a Band, Keeping Dedup Near-Linear
+    def __init__(self, bands: int = MINHASH_BANDS, rows: int = MINHASH_ROWS, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, MERSENNE_PRIME, size=(bands * rows, 1), dtype=np.uint64)
+        self._b = rng.integers(0, MERSENNE_PRIME, size=(bands * rows, 1), dtype=np.uint64)
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+
+    def signature(self, shingles: Set[str]) -> List[int]:
+        # Minimum of Every Permuted Shingle Hash, All Permutations at Once
+        hashes = np.fromiter((zlib.crc32(shingle.encode()) % MERSENNE_PRIME for shingle in shingles), dtype=np.uint64)
+        return ((self._a * hashes + self._b) % MERSENNE_PRIME).min(axis=1).tolist()
+
+    def _bands(self, signature: List[int]) -> List[Tuple[int, ...]]:
+        return [tuple(signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def insert(self, item_id: int, signature: List[int]) -> None:
+        for buckets, band in zip(self._buckets, self._bands(signature)):
+            bucket = buckets.setdefault(band, [])
+            if len(bucket) < MAX_BUCKET_SIZE:
+                bucket.append(item_id)
+
+    def candidates(self, signature: List[int]) -> Set[int]:
+        found: Set[int] = set()
+        for buckets, band in zip(self._buckets, self._bands(signature)):
+            found.update(buckets.get(band, ()))
+        return found
+
+class _Cluster:
+    def __init__(self, lead: Lead, source: str, domain: Optional[str], shingles: Set[str]):
+        self.lead = lead
+        self.domain = domain
+        self.shingles = shingles
+        self.records = [LeadSourceRecord(
+            source=source, leadId=lead.id, company=lead.company, website=lead.website, contact=lead.contact
+        )]
+
+    def absorb(self, lead: Lead, source: str, matched_by: str) -> None:
+        # Keep the First Lead's Values, Filling Whatever it is Missing From the Later One
+        updates: Dict[str, Any] = {}
+        for field in ("company", "industry", "location", "website", "linkedinUrl", "contact", "employees", "priority", "outreachAngle"):
+            if getattr(self.lead, field) in PLACEHOLDERS and getattr(lead, field) not in PLACEHOLDERS:
+                updates[field] = getattr(lead, field)
+        for field in ("emails", "phones", "contacts"):
+            merged = list(getattr(self.lead, field) or [])
+            merged.extend(item for item in getattr(lead, field) or [] if item not in merged)
+            if merged:
+                updates[field] = merged
+        if lead.socialLinks:
+            updates["socialLinks"] = {**lead.socialLinks, **(self.lead.socialLinks or {})}
+        if updates:
+            self.lead = self.lead.model_copy(update=updates)
+        self.records.append(LeadSourceRecord(
+            source=source, leadId=lead.id, company=lead.company, website=lead.website,
+            contact=lead.contact, matchedBy=matched_by
+        ))
+
+class LeadDeduplicator:
+    # Collapse the Same Company Across Sources: Exact Match on Domain, Fuzzy Match on Name Otherwise
+    def __init__(self, name_similarity: float = settings.DEDUP_NAME_SIMILARITY):
+        self.name_similarity = name_similarity
+        self.leads_in = 0
+        self.leads_out = 0
+        self.domain_merges = 0
+        self.name_merges = 0
+
+    async def dedupe_async(self, leads_by_source: Dict[str, List[Lead]]) -> List[Lead]:
+        # Same as dedupe(), Moved Off the Event Loop When the Batch is Large
+        if sum(len(leads) for leads in leads_by_source.values()) > DEDUP_THREAD_THRESHOLD:
+            return await asyncio.to_thread(self.dedupe, leads_by_source)
+        return self.dedupe(leads_by_source)
+
+    def dedupe(self, leads_by_source: Dict[str, List[Lead]]) -> List[Lead]:
+        # Sources are Taken in Order, so Earlier Sources Win Field Conflicts
+        clusters: List[_Cluster] = []
+        by_domain: Dict[str, int] = {}
+        index = MinHashLSH()
+
+        def name_match(shingles: Set[str], signature: List[int], require_no_domain: bool) -> Optional[int]:
+            best, best_score = None, self.name_similarity
+            for cluster_id in index.candidates(signature):
+                cluster = clusters[cluster_id]
+                if require_no_domain and cluster.domain:
+                    continue
+                score = jaccard(shingles, cluster.shingles)
+                if score >= best_score:
+                    best, best_score = cluster_id, score
+            return best
+
+        for source, leads in leads_by_source.items():
+            for lead in leads:
+                self.leads_in += 1
+                domain = dedup_domain(lead.website)
+
+                # Same Domain is the Same Company
+                if domain and domain in by_domain:
+                    clusters[by_domain[domain]].absorb(lead, source, "domain")
+                    self.domain_merges += 1
+                    continue
+
+                name = normalize_company_name(lead.company)
+                shingles = name_shingles(name) if name else set()
+                signature = index.signature(shingles) if shingles else None
+
+                # A Domainless Record Joins any Similar Name; a Record With a New Domain Only Joins a Domainless One
+                match = name_match(shingles, signature, require_no_domain=bool(domain)) if signature else None
+                if match is not None:
+                    cluster = clusters[match]
+                    cluster.absorb(lead, source, "name")
+                    if domain and not cluster.domain:
+                        cluster.domain = domain
+                        by_domain[domain] = match
+                    self.name_merges += 1
+                    continue
+
+                clusters.append(_Cluster(lead, source, domain, shingles))
+                if domain:
+                    by_domain[domain] = len(clusters) - 1
+                if signature:
+                    index.insert(len(clusters) - 1, signature)
+
+        leads = [cluster.lead.model_copy(update={"sourceRecords": cluster.records}) for cluster in clusters]
+        self.leads_out += len(leads)
+        return leads
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "leads_in": self.leads_in,
+            "leads_out": self.leads_out,
+            "domain_merges": self.domain_merges,
+            "name_merges": self.name_merges
+        }
+
+# Initialize Shared Deduplicator
+lead_deduplicator = LeadDeduplicator()
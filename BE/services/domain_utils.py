@@ -0,0 +1,14 @@
+from typing import Optional
+from urllib.parse import urlparse
+
+def normalize_domain(url: Optional[str]) -> Optional[str]:
+    # Lower-Cased Host Without a Leading "www."; None for Missing or Malformed URLs (e.g. "http://[bad")
+    if not url or url == "N/A":
+        return None
+    if "://" not in url:
+        url = f"https://{url}"
+    try:
+        host = (urlparse(url).hostname or "").lower()
+    except ValueError:
+        return None
+    return host.removeprefix("www.") or None
@@ -0,0 +1,285 @@
+import asyncio
+import ipaddress
+import logging
+import re
+import socket
+from typing import Dict, Any, List, Optional, Set
+from urllib.parse import urljoin, urlparse
+import httpcore
+import httpx
+from bs4 import BeautifulSoup
+from models.schemas import Lead
+from services.domain_utils import normalize_domain
+from services.http_client import SharedHTTPClient, http_limits
+from services.host_scheduler import HostScheduler
+from services.search_cache import SearchCache
+from services.single_flight import SingleFlight
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EMAIL_PATTERN = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+PHONE_PATTERN = re.compile(r"(?:\+1[\s.-]?)?\(?\b\d{3}\)?[\s.-]\d{3}[\s.-]\d{4}\b")
+IGNORED_EMAIL_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp")
+IGNORED_EMAIL_DOMAINS = ("example.com", "sentry.io", "wixpress.com", "domain.com")
+SOCIAL_HOSTS = {
+    "linkedin": "linkedin.com",
+    "twitter": "twitter.com",
+    "x": "x.com",
+    "facebook": "facebook.com",
+    "instagram": "instagram.com",
+    "youtube": "youtube.com"
+}
+CONTACT_PAGE_HINTS = ("contact", "about", "team", "impressum")
+MAX_HTML_BYTES = 1_000_000
+MAX_REDIRECTS = 5
+REDIRECT_STATUS_CODES = {301, 302, 303, 307, 308}
+
+class BlockedURLError(ValueError):
+    # Raised for URLs the Crawler Must Not Fetch (Non-HTTP or Resolving to Internal Addresses)
+    pass
+
+def is_public_address(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%")[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+async def resolve_public_address(host: str, port: int) -> str:
+    # Lead Websites Come From Clients: Refuse Loopback, Private, Link-Local & Other Non-Public Targets
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        raise BlockedURLError(f"Cannot resolve {host}: {str(e)}")
+    if not infos or not all(is_public_address(info[4][0]) for info in infos):
+        raise BlockedURLError(f"Refusing non-public address for {host}")
+    return infos[0][4][0]
+
+def check_url_scheme(url: str) -> None:
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise BlockedURLError(f"Unsupported URL: {url}")
+
+class PublicOnlyBackend(httpcore.AsyncNetworkBackend):
+    # Resolve Each Host Once at Connect Time & Dial the Address That Passed the Check, so a DNS Answer
+    # That Changes Between Check and Connect (DNS Rebinding) Cannot Reach an Internal Address
+    def __init__(self):
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(self, host: str, port: int, timeout: Optional[float] = None, local_address: Optional[str] = None, socket_options=None) -> httpcore.AsyncNetworkStream:
+        address = await asyncio.wait_for(resolve_public_address(host, port), timeout)
+        return await self._backend.connect_tcp(address, port, timeout=timeout, local_address=local_address, socket_options=socket_options)
+
+    async def connect_unix_socket(self, path: str, timeout: Optional[float] = None, socket_options=None) -> httpcore.AsyncNetworkStream:
+        raise BlockedURLError(f"Refusing Unix socket {path}")
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+class PublicOnlyTransport(httpx.AsyncHTTPTransport):
+    # The Shared Client's Pooling & HTTP/2 Settings, but Every Connection Goes Through PublicOnlyBackend
+    def __init__(self):
+        limits = http_limits()
+        super().__init__(http2=settings.HTTP2_ENABLED, limits=limits)
+        # httpx Has no Network-Backend Option, so Replace the Pool it Built With One on the Checking Backend
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=settings.HTTP2_ENABLED,
+            network_backend=PublicOnlyBackend()
+        )
+
+class EnrichmentService:
+    # Crawl Each Lead's Homepage & Contact/About Pages for Emails, Phones and Social Links
+    def __init__(self):
+        self.scheduler = HostScheduler(
+            min_interval=settings.ENRICHMENT_HOST_MIN_INTERVAL,
+            max_in_flight=settings.ENRICHMENT_HOST_CONCURRENCY,
+            idle_ttl=settings.ENRICHMENT_HOST_IDLE_TTL
+        )
+        self.cache = SearchCache(
+            max_entries=settings.ENRICHMENT_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.ENRICHMENT_CACHE_TTL,
+            db_path=settings.ENRICHMENT_CACHE_DB_PATH
+        )
+        self.http_client = SharedHTTPClient(transport_factory=PublicOnlyTransport)
+        # Concurrent Enrichments of the Same Domain (Branches, Duplicate Leads) Share One Crawl
+        self.single_flight = SingleFlight()
+        self.sites_crawled = 0
+        self.blocked_urls = 0
+
+    async def close(self) -> None:
+        await self.http_client.close()
+
+    async def enrich_leads(self, leads: List[Lead]) -> List[Lead]:
+        # Enrich Leads Concurrently; Leads Without a Website are Returned Unchanged
+        semaphore = asyncio.Semaphore(settings.ENRICHMENT_CONCURRENCY)
+
+        async def enrich(lead: Lead) -> Lead:
+            async with semaphore:
+                try:
+                    return await self.enrich_lead(lead)
+                except Exception as e:
+                    logger.warning(f"Enrichment failed for {lead.website}: {str(e)}")
+                    return lead
+
+        return list(await asyncio.gather(*(enrich(lead) for lead in leads)))
+
+    async def enrich_lead(self, lead: Lead) -> Lead:
+        domain = normalize_domain(lead.website)
+        if not domain:
+            return lead
+
+        details = await self.crawl_domain(domain, lead.website)
+        updates: Dict[str, Any] = {
+            "emails": details["emails"] or lead.emails,
+            "phones": details["phones"] or lead.phones,
+            "socialLinks": details["social_links"] or lead.socialLinks
+        }
+        if details["social_links"].get("linkedin") and lead.linkedinUrl in (None, "", "N/A"):
+            updates["linkedinUrl"] = details["social_links"]["linkedin"]
+        if lead.contact in (None, "", "Contact Not Available"):
+            if details["emails"]:
+                updates["contact"] = details["emails"][0]
+            elif details["phones"]:
+                updates["contact"] = f"Phone: {details['phones'][0]}"
+        return lead.model_copy(update=updates)
+
+    async def crawl_domain(self, domain: str, website: Optional[str] = None) -> Dict[str, Any]:
+        return await self.single_flight.do(domain, lambda: self._crawl_domain(domain, website))
+
+    async def _crawl_domain(self, domain: str, website: Optional[str] = None) -> Dict[str, Any]:
+        # Cached per Domain: Re-Enriching the Same Company Costs Nothing
+        cache_key = SearchCache.make_key({"domain": domain})
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        homepage_url = website if website and "://" in website else f"https://{domain}/"
+        homepage = await self._fetch(homepage_url)
+        pages = [homepage] if homepage else []
+        if homepage:
+            extra_urls = self._contact_page_urls(homepage[0], homepage[1], domain)
+            extra_pages = await asyncio.gather(*(self._fetch(url) for url in extra_urls))
+            pages.extend(page for page in extra_pages if page)
+
+        details = await asyncio.to_thread(self._extract_all, [html for _, html in pages])
+        self.sites_crawled += 1
+        # Unreachable Sites are Not Cached so a Transient Outage Does Not Stick for the Whole TTL
+        if homepage:
+            await self.cache.set(cache_key, details)
+        return details
+
+    async def _fetch(self, url: str) -> Optional[tuple]:
+        # Fetch One Page Politely; Returns (final_url, html) or None
+        # Redirects are Followed Here, Not by the Client, so Every Hop is Checked Before it is Requested;
+        # the Client's Transport Checks the Resolved Address of Every Connection it Opens
+        try:
+            client = await self.http_client.get_client()
+            for _ in range(MAX_REDIRECTS + 1):
+                check_url_scheme(url)
+                async with self.scheduler.slot(url), client.stream(
+                    "GET", url, timeout=settings.ENRICHMENT_TIMEOUT, follow_redirects=False
+                ) as response:
+                    if response.status_code in REDIRECT_STATUS_CODES and response.headers.get("location"):
+                        url = urljoin(str(response.url), response.headers["location"])
+                        continue
+                    if response.status_code >= 400 or "html" not in response.headers.get("content-type", "html"):
+                        return None
+                    return str(response.url), await self._read_capped(response)
+            logger.info(f"Enrichment fetch gave up after {MAX_REDIRECTS} redirects: {url}")
+            return None
+        except BlockedURLError as e:
+            self.blocked_urls += 1
+            logger.info(f"Enrichment fetch blocked: {str(e)}")
+            return None
+        except Exception as e:
+            logger.info(f"Enrichment fetch failed for {url}: {str(e)}")
+            return None
+
+    async def _read_capped(self, response: httpx.Response) -> str:
+        # Stop Downloading at MAX_HTML_BYTES Instead of Truncating a Fully Downloaded Body
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body.extend(chunk)
+            if len(body) >= MAX_HTML_BYTES:
+                break
+        return bytes(body[:MAX_HTML_BYTES]).decode(response.encoding or "utf-8", errors="replace")
+
+    def _contact_page_urls(self, base_url: str, html: str, domain: str) -> List[str]:
+        # Same-Site Links Whose Path Looks Like a Contact or About Page
+        soup = BeautifulSoup(html, "lxml")
+        urls: List[str] = []
+        for anchor in soup.find_all("a", href=True):
+            url = urljoin(base_url, anchor["href"]).split("#")[0]
+            if normalize_domain(url) != domain or url in urls:
+                continue
+            path = urlparse(url).path.lower()
+            if any(hint in path for hint in CONTACT_PAGE_HINTS):
+                urls.append(url)
+            if len(urls) >= settings.ENRICHMENT_MAX_EXTRA_PAGES:
+                break
+        return urls
+
+    def _extract_all(self, pages: List[str]) -> Dict[str, Any]:
+        emails: List[str] = []
+        phones: List[str] = []
+        social_links: Dict[str, str] = {}
+        seen_emails: Set[str] = set()
+        seen_phones: Set[str] = set()
+
+        for html in pages:
+            soup = BeautifulSoup(html, "lxml")
+            candidates_email: List[str] = []
+            candidates_phone: List[str] = []
+            for anchor in soup.find_all("a", href=True):
+                href = anchor["href"].strip()
+                lowered = href.lower()
+                if lowered.startswith("mailto:"):
+                    candidates_email.append(href[7:].split("?")[0])
+                elif lowered.startswith("tel:"):
+                    candidates_phone.append(href[4:])
+                else:
+                    host = (urlparse(href).hostname or "").lower().removeprefix("www.")
+                    for name, social_host in SOCIAL_HOSTS.items():
+                        if (host == social_host or host.endswith(f".{social_host}")) and name not in social_links:
+                            social_links[name] = href
+
+            text = soup.get_text(" ")
+            candidates_email.extend(EMAIL_PATTERN.findall(text))
+            candidates_phone.extend(PHONE_PATTERN.findall(text))
+
+            for email in candidates_email:
+                email = email.strip().lower()
+                if (
+                    email and email not in seen_emails
+                    and not email.endswith(IGNORED_EMAIL_SUFFIXES)
+                    and not email.split("@")[-1].endswith(IGNORED_EMAIL_DOMAINS)
+                ):
+                    seen_emails.add(email)
+                    emails.append(email)
+            for phone in candidates_phone:
+                digits = re.sub(r"\D", "", phone)
+                if len(digits) == 11 and digits.startswith("1"):
+                    digits = digits[1:]
+                if 10 <= len(digits) <= 15 and digits not in seen_phones:
+                    seen_phones.add(digits)
+                    phones.append(phone.strip())
+
+        return {"emails": emails[:10], "phones": phones[:5], "social_links": social_links}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sites_crawled": self.sites_crawled,
+            "blocked_urls": self.blocked_urls,
+            "hosts_tracked": len(self.scheduler.stats()),
+            "hosts_expired": self.scheduler.expired,
+            "crawls_shared": self.single_flight.shared,
+            "cache": self.cache.stats()
+        }
+
+# Initialize Shared Enrichment Service
+enrichment_service = EnrichmentService()
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, Optional
+from urllib.parse import urlparse
+from core.config import settings
+
+class _HostState:
+    def __init__(self, min_interval: float, max_in_flight: int):
+        self.min_interval = min_interval
+        self.max_in_flight = max_in_flight
+        self.semaphore = asyncio.Semaphore(max_in_flight)
+        self.next_start = 0.0
+        self.in_flight = 0
+        self.users = 0
+        self.last_used = time.monotonic()
+        self.pinned = False
+        self.requests = 0
+        self.total_wait = 0.0
+
+class HostScheduler:
+    # Process-Wide Politeness: per Host, at Most N Requests in Flight & a Minimum Interval Between Request Starts
+    def __init__(self, min_interval: float, max_in_flight: int, idle_ttl: Optional[float] = None):
+        self.min_interval = min_interval
+        self.max_in_flight = max_in_flight
+        # Hosts Unused for idle_ttl Seconds are Forgotten; None Keeps Every Host (Fine for a Few Fixed Sites)
+        self.idle_ttl = idle_ttl
+        self._hosts: Dict[str, _HostState] = {}
+        self._next_sweep = time.monotonic() + (idle_ttl or 0)
+        self.expired = 0
+
+    def configure(self, host: str, min_interval: Optional[float] = None, max_in_flight: Optional[int] = None) -> None:
+        # Override Limits for One Host (Applies to Requests Scheduled Afterwards)
+        current = self._hosts.get(host)
+        state = _HostState(
+            min_interval if min_interval is not None else (current.min_interval if current else self.min_interval),
+            max_in_flight if max_in_flight is not None else (current.max_in_flight if current else self.max_in_flight)
+        )
+        if current:
+            state.next_start = current.next_start
+        state.pinned = True
+        self._hosts[host] = state
+
+    def _expire_idle(self, now: float) -> None:
+        # Drop Idle, Unconfigured Hosts Whose Politeness Interval Has Long Passed
+        self._next_sweep = now + self.idle_ttl
+        cutoff = now - self.idle_ttl
+        idle = [
+            host for host, state in self._hosts.items()
+            if not state.users and not state.pinned and state.last_used < cutoff and state.next_start < now
+        ]
+        for host in idle:
+            del self._hosts[host]
+        self.expired += len(idle)
+
+    def _state(self, host: str) -> _HostState:
+        if self.idle_ttl is not None:
+            now = time.monotonic()
+            if now >= self._next_sweep:
+                self._expire_idle(now)
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.min_interval, self.max_in_flight)
+        return state
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        # Wait for a Free Slot & the Host's Next Start Time, Then Run the Request
+        state = self._state(urlparse(url).hostname or "")
+        state.users += 1
+        try:
+            async with state.semaphore:
+                # Reserve a Start Time Without Holding a Lock While Sleeping: Starts are Spaced min_interval Apart
+                now = time.monotonic()
+                start_at = max(now, state.next_start)
+                state.next_start = start_at + state.min_interval
+                wait = start_at - now
+                if wait > 0:
+                    state.total_wait += wait
+                    await asyncio.sleep(wait)
+                state.in_flight += 1
+                state.requests += 1
+                try:
+                    yield
+                finally:
+                    state.in_flight -= 1
+        finally:
+            state.users -= 1
+            state.last_used = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            host: {
+                "in_flight": state.in_flight,
+                "max_in_flight": state.max_in_flight,
+                "min_interval": state.min_interval,
+                "requests": state.requests,
+                "total_wait_seconds": round(state.total_wait, 3)
+            }
+            for host, state in self._hosts.items()
+        }
+
+# Initialize Shared Host Scheduler
+host_scheduler = HostScheduler(
+    min_interval=settings.SCRAPING_DELAY,
+    max_in_flight=settings.SCRAPING_HOST_CONCURRENCY
+)
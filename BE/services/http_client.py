@@ -0,0 +1,45 @@
+import httpx
+from typing import Callable, Optional
+from core.config import settings
+
+def http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY
+    )
+
+class SharedHTTPClient:
+    # App-Lifetime Pooled HTTP Client for Plain Page Fetches (Non-Apollo)
+    def __init__(self, transport_factory: Optional[Callable[[], httpx.AsyncBaseTransport]] = None):
+        self.client: Optional[httpx.AsyncClient] = None
+        self.transport_factory = transport_factory
+
+    async def start(self) -> None:
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                timeout=settings.REQUEST_TIMEOUT,
+                http2=settings.HTTP2_ENABLED,
+                follow_redirects=True,
+                limits=http_limits(),
+                transport=self.transport_factory() if self.transport_factory else None,
+                headers={
+                    "User-Agent": settings.USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.9"
+                }
+            )
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def get_client(self) -> httpx.AsyncClient:
+        # Return the Shared Client, Opening it Lazily if Used Outside the App Lifespan
+        if self.client is None or self.client.is_closed:
+            await self.start()
+        return self.client
+
+# Initialize Shared HTTP Client
+http_client = SharedHTTPClient()
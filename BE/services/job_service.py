@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import AsyncIterator, Dict, Any, List, Optional
+from models.schemas import JobStatus, Lead, ScrapeJob, ScrapeJobRequest
+from services.source_adapters import normalize
+from services.scraper_service import ScraperService
+from services.admission import scrape_admission
+from services.lead_store import lead_store
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class JobQueueFullError(Exception):
+    # Raised When the Job Queue Cannot Accept More Work
+    pass
+
+class _JobState:
+    def __init__(self, job_id: str, request: ScrapeJobRequest):
+        self.job = ScrapeJob(
+            id=job_id,
+            status=JobStatus.QUEUED,
+            request=request,
+            pages_total=request.max_pages,
+            created_at=datetime.now()
+        )
+        self.leads: List[Lead] = []
+        self.changed = asyncio.Event()
+
+    def notify(self) -> None:
+        # Wake Every Progress Stream Waiting on This Job
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+class JobManager:
+    # Bounded Worker Pool Running Scrapes Outside the HTTP Request
+    def __init__(self, workers: int, queue_size: int, retention: int):
+        self.workers = workers
+        self.retention = retention
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=queue_size)
+        self._jobs: "OrderedDict[str, _JobState]" = OrderedDict()
+        self._tasks: List[asyncio.Task] = []
+        self.scraper = ScraperService()
+
+    async def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker(index)) for index in range(self.workers)]
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, request: ScrapeJobRequest) -> ScrapeJob:
+        # Queue a Scrape & Return its Job Immediately
+        job_id = str(uuid.uuid4())
+        state = _JobState(job_id, request)
+        try:
+            self._queue.put_nowait(job_id)
+        except asyncio.QueueFull:
+            raise JobQueueFullError(f"Job queue is full ({self._queue.maxsize} jobs waiting)")
+        self._jobs[job_id] = state
+        self._evict_finished()
+        return state.job
+
+    def get(self, job_id: str, include_leads: bool = False) -> Optional[ScrapeJob]:
+        # Snapshot a Job; Leads Found So Far are Included on Request, Even While it is Still Running
+        state = self._jobs.get(job_id)
+        if state is None:
+            return None
+        return state.job.model_copy(update={"leads": list(state.leads) if include_leads else None})
+
+    async def events(self, job_id: str, heartbeat: float = 15.0) -> AsyncIterator[Optional[ScrapeJob]]:
+        # Yield a Snapshot on Every Progress Update Until the Job Finishes; None Means Heartbeat
+        state = self._jobs.get(job_id)
+        if state is None:
+            return
+        while True:
+            changed = state.changed
+            yield self.get(job_id)
+            if state.job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+
+    def _evict_finished(self) -> None:
+        # Keep at Most `retention` Jobs, Dropping the Oldest Finished Ones First
+        finished = [job_id for job_id, state in self._jobs.items() if state.job.status in (JobStatus.COMPLETED, JobStatus.FAILED)]
+        while len(self._jobs) > self.retention and finished:
+            self._jobs.pop(finished.pop(0), None)
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                state = self._jobs.get(job_id)
+                if state is not None:
+                    await self._run(state)
+            except Exception as e:
+                logger.error(f"Job worker {index} crashed on job {job_id}: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, state: _JobState) -> None:
+        job, request = state.job, state.job.request
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.now()
+        state.notify()
+
+        def on_page(page_num: int, companies: List[Dict[str, Any]]) -> None:
+            # Publish Each Page's Leads as Soon as it is Scraped
+            state.leads.extend(normalize(companies, request.source))
+            job.pages_done += 1
+            job.leads_found = len(state.leads)
+            state.notify()
+
+        status, error = JobStatus.FAILED, None
+        try:
+            # Jobs Share the Global Scrape Limit but Wait in Their Own Queue Instead of Being Shed
+            async with scrape_admission.admit(bypass_queue_limit=True):
+                if request.source == "apollo":
+                    await self.scraper.scrape_apollo_companies(request.industry, request.location, request.max_pages, on_page=on_page)
+                else:
+                    await self.scraper.scrape_yellow_pages(request.industry, request.location, request.max_pages, on_page=on_page)
+            status = JobStatus.COMPLETED
+        except Exception as e:
+            logger.error(f"Scrape job {job.id} failed: {str(e)}")
+            error = str(e)
+        finally:
+            # Keep Whatever Was Found, Even From a Failed Job, in One Write
+            try:
+                await lead_store.put_leads(state.leads)
+            except Exception as e:
+                logger.error(f"Storing leads of job {job.id} failed: {str(e)}")
+            job.finished_at = datetime.now()
+            # Publish the Final Status Last: a Client That Sees it Can Already Read the Stored Leads
+            job.error = error
+            job.status = status
+            state.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        statuses: Dict[str, int] = {}
+        for state in self._jobs.values():
+            statuses[state.job.status.value] = statuses.get(state.job.status.value, 0) + 1
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "jobs": statuses
+        }
+
+# Initialize Shared Job Manager
+job_manager = JobManager(
+    workers=settings.JOB_WORKERS,
+    queue_size=settings.JOB_QUEUE_SIZE,
+    retention=settings.JOB_RETENTION
+)
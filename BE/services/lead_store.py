@@ -0,0 +1,524 @@
+import asyncio
+import bisect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Optional, Tuple
+from models.schemas import Lead, OutreachMessage, SearchHit
+from services.domain_utils import normalize_domain
+from services.text_index import InvertedIndex, fts5_query, make_snippet
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Lead Fields With a Secondary Index; Values are Stored Normalized so Lookups Ignore Case & Spacing
+INDEXED_FIELDS = ("industry", "location", "priority", "domain")
+
+def index_key(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return " ".join(value.lower().split()) or None
+
+def project(data: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    # Keep Only the Requested Fields (the ID Always Comes Along)
+    if not fields:
+        return data
+    return {field: data.get(field) for field in dict.fromkeys(("id", *fields))}
+
+def merge_hits(hit_lists: List[List[SearchHit]], limit: int, offset: int) -> Tuple[List[SearchHit], bool]:
+    # Interleave Per-Kind Result Lists by Score; Each List Holds at Least offset + limit + 1 Hits
+    ranked = sorted((hit for hits in hit_lists for hit in hits), key=lambda hit: hit.score, reverse=True)
+    return ranked[offset:offset + limit], len(ranked) > offset + limit
+
+def lead_text(lead: Lead) -> str:
+    return " · ".join(filter(None, (lead.company, lead.industry, lead.outreachAngle)))
+
+def message_text(message: OutreachMessage) -> str:
+    return " · ".join(filter(None, (message.subject, message.message)))
+
+def indexed_values(lead: Lead) -> Dict[str, Optional[str]]:
+    return {
+        "industry": index_key(lead.industry),
+        "location": index_key(lead.location),
+        "priority": index_key(lead.priority),
+        "domain": normalize_domain(lead.website)
+    }
+
+def filter_keys(**values: Optional[str]) -> Dict[str, Optional[str]]:
+    # Normalize Query Filters the Same Way Their Indexed Values Were Stored
+    return {field: normalize_domain(value) if field == "domain" else index_key(value) for field, value in values.items() if value}
+
+class LeadStore(ABC):
+    # Storage Backend for Leads & Outreach Messages; Writes Take a Whole Batch at Once
+    backend = ""
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    async def put_leads(self, leads: List[Lead]) -> None:
+        ...
+
+    @abstractmethod
+    async def get_lead(self, lead_id: str) -> Optional[Lead]:
+        ...
+
+    @abstractmethod
+    async def query_leads(
+        self,
+        limit: int,
+        before_seq: Optional[int] = None,
+        industry: Optional[str] = None,
+        location: Optional[str] = None,
+        priority: Optional[str] = None,
+        domain: Optional[str] = None,
+        updated_since: Optional[float] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        # Newest-First Page of Leads Matching Every Given Filter; Returns (Leads, Cursor for the Next Page)
+        ...
+
+    @abstractmethod
+    async def search(self, query: str, limit: int, offset: int = 0, kind: Optional[str] = None) -> Tuple[List[SearchHit], bool]:
+        # Ranked Full-Text Hits Over Leads & Messages ('lead' or 'message' Narrows it); Returns (Hits, More Available)
+        ...
+
+    async def put_message(self, message: OutreachMessage) -> None:
+        await self.put_messages([message])
+
+    @abstractmethod
+    async def put_messages(self, messages: List[OutreachMessage]) -> None:
+        ...
+
+    @abstractmethod
+    async def get_message(self, message_id: str) -> Optional[OutreachMessage]:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        ...
+
+class MemoryLeadStore(LeadStore):
+    # Process-Local Dicts; Contents are Lost on Restart. Every Write Gets a New seq & is Appended to
+    # seq-Ordered Posting Lists (All Leads + One per Indexed Value), so Pages are Found by Bisection.
+    # Superseded Entries Stay in the Lists & are Skipped When Their seq No Longer Matches the Lead's,
+    # Until They Outnumber the Live Leads & the Lists are Compacted (Amortized O(1) per Write).
+    backend = "memory"
+
+    # Small Stores Tolerate This Many Stale Entries Before Compacting
+    MIN_STALE_BEFORE_COMPACT = 64
+
+    def __init__(self):
+        self._leads: Dict[str, Lead] = {}
+        self._messages: Dict[str, OutreachMessage] = {}
+        self._order: List[Tuple[int, str]] = []
+        self._indexes: Dict[str, Dict[str, List[Tuple[int, str]]]] = {field: {} for field in INDEXED_FIELDS}
+        self._keys: Dict[str, Dict[str, Optional[str]]] = {}
+        self._seq: Dict[str, Tuple[int, float]] = {}
+        self._next_seq = 1
+        self._last_write = 0.0
+        self._stale = 0
+        self.compactions = 0
+        self._lead_text = InvertedIndex()
+        self._message_text = InvertedIndex()
+        self.lead_writes = 0
+
+    def _is_current(self, entry: Tuple[int, str]) -> bool:
+        return self._seq.get(entry[1], (None,))[0] == entry[0]
+
+    async def put_leads(self, leads: List[Lead]) -> None:
+        # Never Behind the Previous Write, so Write Times Grow With seq Even if the Clock Steps Back
+        now = self._last_write = max(time.time(), self._last_write)
+        for lead in leads:
+            entry = (self._next_seq, lead.id)
+            self._next_seq += 1
+            keys = indexed_values(lead)
+            for field, value in keys.items():
+                if value is not None:
+                    self._indexes[field].setdefault(value, []).append(entry)
+            self._order.append(entry)
+            if lead.id in self._seq:
+                self._stale += 1
+            self._keys[lead.id] = keys
+            self._leads[lead.id] = lead
+            self._seq[lead.id] = (entry[0], now)
+            self._lead_text.add(lead.id, lead_text(lead))
+        self.lead_writes += len(leads)
+        if self._stale > max(self.MIN_STALE_BEFORE_COMPACT, len(self._leads)):
+            self._compact()
+
+    def _compact(self) -> None:
+        # Drop Superseded Entries so Page Cost Tracks Live Leads, Not the Number of Rewrites
+        self._order = [entry for entry in self._order if self._is_current(entry)]
+        for postings in self._indexes.values():
+            for value in list(postings):
+                live = [entry for entry in postings[value] if self._is_current(entry)]
+                if live:
+                    postings[value] = live
+                else:
+                    del postings[value]
+        self._stale = 0
+        self.compactions += 1
+
+    async def get_lead(self, lead_id: str) -> Optional[Lead]:
+        return self._leads.get(lead_id)
+
+    async def query_leads(
+        self,
+        limit: int,
+        before_seq: Optional[int] = None,
+        industry: Optional[str] = None,
+        location: Optional[str] = None,
+        priority: Optional[str] = None,
+        domain: Optional[str] = None,
+        updated_since: Optional[float] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        # Walk the Shortest Matching Posting List Backwards From the Cursor, Checking the Other Filters per Lead
+        filters = filter_keys(industry=industry, location=location, priority=priority, domain=domain)
+        postings = sorted((self._indexes[field].get(value, []) for field, value in filters.items()), key=len)
+        entries = postings[0] if postings else self._order
+        position = bisect.bisect_left(entries, (before_seq,)) if before_seq is not None else len(entries)
+
+        page: List[Tuple[int, str]] = []
+        while position > 0 and len(page) <= limit:
+            position -= 1
+            entry = entries[position]
+            if not self._is_current(entry):
+                continue
+            if updated_since is not None and self._seq[entry[1]][1] < updated_since:
+                # Write Times Never Decrease With seq, so Every Older Entry Was Written Even Earlier
+                break
+            keys = self._keys[entry[1]]
+            if all(keys[field] == value for field, value in filters.items()):
+                page.append(entry)
+
+        next_seq = page[limit - 1][0] if len(page) > limit else None
+        leads = [project(self._leads[lead_id].model_dump(), fields) for _, lead_id in page[:limit]]
+        return leads, next_seq
+
+    async def put_messages(self, messages: List[OutreachMessage]) -> None:
+        for message in messages:
+            if message.id:
+                self._messages[message.id] = message
+                self._message_text.add(message.id, message_text(message))
+
+    async def search(self, query: str, limit: int, offset: int = 0, kind: Optional[str] = None) -> Tuple[List[SearchHit], bool]:
+        window = offset + limit + 1
+        hit_lists: List[List[SearchHit]] = []
+        if kind in (None, "lead"):
+            hit_lists.append([
+                SearchHit(
+                    kind="lead", id=lead_id, lead_id=lead_id, company=self._leads[lead_id].company,
+                    score=round(score, 4), snippet=make_snippet(lead_text(self._leads[lead_id]), query)
+                )
+                for lead_id, score in self._lead_text.search(query, window)
+            ])
+        if kind in (None, "message"):
+            hits = []
+            for message_id, score in self._message_text.search(query, window):
+                message = self._messages[message_id]
+                lead = self._leads.get(message.lead_id)
+                hits.append(SearchHit(
+                    kind="message", id=message_id, lead_id=message.lead_id, company=lead.company if lead else None,
+                    score=round(score, 4), snippet=make_snippet(message_text(message), query)
+                ))
+            hit_lists.append(hits)
+        return merge_hits(hit_lists, limit, offset)
+
+    async def get_message(self, message_id: str) -> Optional[OutreachMessage]:
+        return self._messages.get(message_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "leads": len(self._leads),
+            "messages": len(self._messages),
+            "indexed_documents": len(self._lead_text) + len(self._message_text),
+            "lead_writes": self.lead_writes,
+            "compactions": self.compactions
+        }
+
+class SQLiteLeadStore(LeadStore):
+    # Durable Store: One WAL-Mode SQLite File, Lead JSON Plus Indexed Columns for Filtering.
+    # Writes Share One Connection Under a Lock; Each Worker Thread Reads Through its Own Read-Only
+    # Connection, so Reads See the Last Committed Snapshot Instead of Waiting on a Write
+    backend = "sqlite"
+
+    SCHEMA = (
+        # seq Increases on Every Write, so it Doubles as a Stable Recency Order
+        "CREATE TABLE IF NOT EXISTS leads ("
+        "seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT NOT NULL UNIQUE, "
+        "industry TEXT, location TEXT, priority TEXT, domain TEXT, "
+        "updated_at REAL NOT NULL, data TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS idx_leads_industry ON leads (industry, seq)",
+        "CREATE INDEX IF NOT EXISTS idx_leads_location ON leads (location, seq)",
+        "CREATE INDEX IF NOT EXISTS idx_leads_priority ON leads (priority, seq)",
+        "CREATE INDEX IF NOT EXISTS idx_leads_domain ON leads (domain, seq)",
+        "CREATE INDEX IF NOT EXISTS idx_leads_updated_at ON leads (updated_at)",
+        "CREATE TABLE IF NOT EXISTS messages ("
+        "id TEXT PRIMARY KEY, lead_id TEXT NOT NULL, generated_at TEXT, data TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS idx_messages_lead_id ON messages (lead_id)",
+        # Full-Text Indexes Keyed by the Owning Row's rowid (leads.seq / messages.rowid)
+        "CREATE VIRTUAL TABLE IF NOT EXISTS leads_fts USING fts5("
+        "company, industry, outreach_angle, tokenize='unicode61 remove_diacritics 2')",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5("
+        "subject, message, tokenize='unicode61 remove_diacritics 2')"
+    )
+
+    # Backfill Full-Text Indexes for Rows Stored Before They Existed
+    BACKFILL = (
+        ("leads_fts", "leads",
+         "INSERT INTO leads_fts (rowid, company, industry, outreach_angle) "
+         "SELECT seq, json_extract(data, '$.company'), json_extract(data, '$.industry'), json_extract(data, '$.outreachAngle') FROM leads"),
+        ("messages_fts", "messages",
+         "INSERT INTO messages_fts (rowid, subject, message) "
+         "SELECT rowid, json_extract(data, '$.subject'), json_extract(data, '$.message') FROM messages")
+    )
+
+    # Column Weights for bm25(): a Hit in the Company Name Counts Most
+    LEAD_RANK = "bm25(leads_fts, 10.0, 3.0, 1.0)"
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._readers: Dict[int, sqlite3.Connection] = {}
+        self._readers_lock = threading.Lock()
+        self._last_write = 0.0
+        self.lead_writes = 0
+        self.write_batches = 0
+
+    def _open(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(self.db_path, check_same_thread=False)
+            # WAL Lets the Read Connections Proceed During a Write; NORMAL Sync is Durable Across App Crashes
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.SCHEMA:
+                db.execute(statement)
+            for fts_table, table, backfill in self.BACKFILL:
+                if db.execute(f"SELECT 1 FROM {fts_table} LIMIT 1").fetchone() is None and db.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone():
+                    db.execute(backfill)
+            db.commit()
+            self._last_write = db.execute("SELECT COALESCE(MAX(updated_at), 0) FROM leads").fetchone()[0]
+            self._db = db
+        return self._db
+
+    def _run(self, work, *args):
+        # Writes (& Schema Setup) are Serialized on the Single Write Connection
+        with self._db_lock:
+            return work(self._open(), *args)
+
+    def _reader(self) -> sqlite3.Connection:
+        # This Thread's Read-Only Connection, Opened After the Writer Has Created the Schema
+        thread_id = threading.get_ident()
+        reader = self._readers.get(thread_id)
+        if reader is None:
+            if self._db is None:
+                self._run(lambda db: None)
+            reader = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+            with self._readers_lock:
+                self._readers[thread_id] = reader
+        return reader
+
+    def _read(self, work, *args):
+        return work(self._reader(), *args)
+
+    async def _call(self, work, *args):
+        return await asyncio.to_thread(self._run, work, *args)
+
+    async def _query(self, work, *args):
+        return await asyncio.to_thread(self._read, work, *args)
+
+    async def start(self) -> None:
+        await self._call(lambda db: None)
+
+    async def close(self) -> None:
+        with self._readers_lock:
+            readers, self._readers = list(self._readers.values()), {}
+        for reader in readers:
+            reader.close()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    async def put_leads(self, leads: List[Lead]) -> None:
+        if not leads:
+            return
+        rows = []
+        for lead in leads:
+            keys = indexed_values(lead)
+            rows.append((
+                lead.id, keys["industry"], keys["location"], keys["priority"], keys["domain"],
+                lead.model_dump_json(), (lead.company, lead.industry, lead.outreachAngle)
+            ))
+
+        def write(db: sqlite3.Connection, rows: List[Tuple]) -> None:
+            # One Transaction per Batch; the Full-Text Row Moves With the Lead's New seq.
+            # Stamped Under the Write Lock & Never Behind the Previous Batch, so updated_at Grows With seq
+            now = self._last_write = max(time.time(), self._last_write)
+            with db:
+                for *row, data, text in rows:
+                    previous = db.execute("SELECT seq FROM leads WHERE id = ?", (row[0],)).fetchone()
+                    if previous:
+                        db.execute("DELETE FROM leads_fts WHERE rowid = ?", previous)
+                    seq = db.execute(
+                        "INSERT OR REPLACE INTO leads (id, industry, location, priority, domain, updated_at, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (*row, now, data)
+                    ).lastrowid
+                    db.execute("INSERT INTO leads_fts (rowid, company, industry, outreach_angle) VALUES (?, ?, ?, ?)", (seq, *text))
+
+        await self._call(write, rows)
+        self.lead_writes += len(rows)
+        self.write_batches += 1
+
+    async def get_lead(self, lead_id: str) -> Optional[Lead]:
+        row = await self._query(lambda db: db.execute("SELECT data FROM leads WHERE id = ?", (lead_id,)).fetchone())
+        return Lead.model_validate_json(row[0]) if row else None
+
+    async def query_leads(
+        self,
+        limit: int,
+        before_seq: Optional[int] = None,
+        industry: Optional[str] = None,
+        location: Optional[str] = None,
+        priority: Optional[str] = None,
+        domain: Optional[str] = None,
+        updated_since: Optional[float] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        # Keyset Pagination on seq: Each Page is an Index Range Scan That Stops After limit + 1 Rows
+        def read(db: sqlite3.Connection) -> List[Tuple[int, str]]:
+            clauses, params = [], []
+            for field, value in filter_keys(industry=industry, location=location, priority=priority, domain=domain).items():
+                clauses.append(f"{field} = ?")
+                params.append(value)
+            if before_seq is not None:
+                clauses.append("seq < ?")
+                params.append(before_seq)
+            if updated_since is not None:
+                # seq & updated_at Grow Together, so the First Row at or After the Cutoff Bounds the Scan
+                first = db.execute(
+                    "SELECT seq FROM leads WHERE updated_at >= ? ORDER BY updated_at LIMIT 1", (updated_since,)
+                ).fetchone()
+                if first is None:
+                    return []
+                clauses.extend(["seq >= ?", "updated_at >= ?"])
+                params.extend([first[0], updated_since])
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            return db.execute(
+                f"SELECT seq, data FROM leads {where} ORDER BY seq DESC LIMIT ?", (*params, limit + 1)
+            ).fetchall()
+
+        rows = await self._query(read)
+        page = rows[:limit]
+        # Stored JSON Was Validated on the Way in, so it is Decoded Without Re-Validation
+        leads = [project(json.loads(data), fields) for _, data in page]
+        next_seq = page[-1][0] if len(rows) > limit else None
+        return leads, next_seq
+
+    async def put_messages(self, messages: List[OutreachMessage]) -> None:
+        rows = [
+            (
+                message.id, message.lead_id, message.generated_at.isoformat() if message.generated_at else None,
+                message.model_dump_json(), (message.subject, message.message)
+            )
+            for message in messages if message.id
+        ]
+        if not rows:
+            return
+
+        def write(db: sqlite3.Connection, rows: List[Tuple]) -> None:
+            with db:
+                for *row, text in rows:
+                    previous = db.execute("SELECT rowid FROM messages WHERE id = ?", (row[0],)).fetchone()
+                    if previous:
+                        db.execute("DELETE FROM messages_fts WHERE rowid = ?", previous)
+                    rowid = db.execute(
+                        "INSERT OR REPLACE INTO messages (id, lead_id, generated_at, data) VALUES (?, ?, ?, ?)", row
+                    ).lastrowid
+                    db.execute("INSERT INTO messages_fts (rowid, subject, message) VALUES (?, ?, ?)", (rowid, *text))
+
+        await self._call(write, rows)
+
+    async def search(self, query: str, limit: int, offset: int = 0, kind: Optional[str] = None) -> Tuple[List[SearchHit], bool]:
+        match = fts5_query(query)
+        if match is None:
+            return [], False
+        window = offset + limit + 1
+
+        def read(db: sqlite3.Connection) -> List[List[SearchHit]]:
+            # FTS5 bm25() is Lower-is-Better, so Scores are Negated to Rank Best First
+            hit_lists = []
+            if kind in (None, "lead"):
+                rows = db.execute(
+                    f"SELECT leads.id, -{self.LEAD_RANK} AS score, snippet(leads_fts, -1, '[', ']', '…', 10), "
+                    "json_extract(leads.data, '$.company') "
+                    "FROM leads_fts JOIN leads ON leads.seq = leads_fts.rowid "
+                    "WHERE leads_fts MATCH ? ORDER BY score DESC LIMIT ?",
+                    (match, window)
+                ).fetchall()
+                hit_lists.append([
+                    SearchHit(kind="lead", id=lead_id, lead_id=lead_id, company=company, score=round(score, 4), snippet=snippet)
+                    for lead_id, score, snippet, company in rows
+                ])
+            if kind in (None, "message"):
+                rows = db.execute(
+                    "SELECT messages.id, messages.lead_id, -bm25(messages_fts) AS score, "
+                    "snippet(messages_fts, -1, '[', ']', '…', 10), json_extract(leads.data, '$.company') "
+                    "FROM messages_fts JOIN messages ON messages.rowid = messages_fts.rowid "
+                    "LEFT JOIN leads ON leads.id = messages.lead_id "
+                    "WHERE messages_fts MATCH ? ORDER BY score DESC LIMIT ?",
+                    (match, window)
+                ).fetchall()
+                hit_lists.append([
+                    SearchHit(kind="message", id=message_id, lead_id=lead_id, company=company, score=round(score, 4), snippet=snippet)
+                    for message_id, lead_id, score, snippet, company in rows
+                ])
+            return hit_lists
+
+        return merge_hits(await self._query(read), limit, offset)
+
+    async def get_message(self, message_id: str) -> Optional[OutreachMessage]:
+        row = await self._query(lambda db: db.execute("SELECT data FROM messages WHERE id = ?", (message_id,)).fetchone())
+        return OutreachMessage.model_validate_json(row[0]) if row else None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "db_path": self.db_path,
+            "open": self._db is not None,
+            "read_connections": len(self._readers),
+            "lead_writes": self.lead_writes,
+            "write_batches": self.write_batches
+        }
+
+def create_lead_store(backend: str = settings.LEAD_STORE_BACKEND) -> LeadStore:
+    # Pick the Configured Backend; SQLite Falls Back to Memory if its File Cannot be Opened
+    if backend == "memory":
+        return MemoryLeadStore()
+    if backend != "sqlite":
+        raise ValueError(f"Unknown lead store backend '{backend}' (expected 'sqlite' or 'memory')")
+    store = SQLiteLeadStore(settings.LEAD_STORE_DB_PATH)
+    try:
+        store._run(lambda db: None)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"SQLite lead store unavailable, keeping leads in memory: {str(e)}")
+        return MemoryLeadStore()
+    return store
+
+# Initialize Shared Lead Store
+lead_store = create_lead_store()
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Any, Optional, Set
+from urllib.parse import urlparse
+from playwright.async_api import Page, Request, Response, Route
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Resource Types the Scrapers Never Need: Only the DOM Matters
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet", "manifest", "texttrack"}
+
+# Analytics, Ads & Session-Replay Hosts (Matched on Domain Suffix)
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "facebook.net",
+    "connect.facebook.com",
+    "bat.bing.com",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "fullstory.com",
+    "intercom.io",
+    "nr-data.net",
+    "newrelic.com",
+    "optimizely.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+    "adnxs.com",
+    "moatads.com"
+)
+
+def is_blocked_host(url: str) -> bool:
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == blocked or host.endswith(f".{blocked}") for blocked in BLOCKED_HOSTS)
+
+class ScrapeMetrics:
+    # Running Averages of Bytes & Load Time per Page, Split by Source and Mode
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, float]] = {}
+        self._savings: Dict[str, Dict[str, Any]] = {}
+
+    def record_savings(self, summary: Dict[str, Any]) -> None:
+        # Accumulate What Lean Scrapes Saved Against the Full-Mode Baseline & Keep the Latest One
+        savings = self._savings.setdefault(summary["source"], {"scrapes": 0, "bytes_saved": 0, "load_ms_saved": 0.0, "last": None})
+        savings["scrapes"] += 1
+        savings["bytes_saved"] += summary["bytes_saved"]
+        savings["load_ms_saved"] += summary["load_ms_saved"]
+        savings["last"] = summary
+
+    def record(self, source: str, lean: bool, pages: int, bytes_loaded: int, load_ms: float, blocked: int) -> None:
+        totals = self._totals.setdefault(f"{source}:{'lean' if lean else 'full'}", {
+            "pages": 0, "bytes_loaded": 0, "load_ms": 0.0, "requests_blocked": 0
+        })
+        totals["pages"] += pages
+        totals["bytes_loaded"] += bytes_loaded
+        totals["load_ms"] += load_ms
+        totals["requests_blocked"] += blocked
+
+    def per_page(self, source: str, lean: bool) -> Optional[Dict[str, float]]:
+        totals = self._totals.get(f"{source}:{'lean' if lean else 'full'}")
+        if not totals or not totals["pages"]:
+            return None
+        return {
+            "bytes_loaded": totals["bytes_loaded"] / totals["pages"],
+            "load_ms": totals["load_ms"] / totals["pages"]
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        report = {}
+        for key, totals in self._totals.items():
+            pages = totals["pages"] or 1
+            report[key] = {
+                "pages": totals["pages"],
+                "avg_bytes_per_page": round(totals["bytes_loaded"] / pages),
+                "avg_load_ms_per_page": round(totals["load_ms"] / pages, 1),
+                "requests_blocked": totals["requests_blocked"]
+            }
+        for source, savings in self._savings.items():
+            report[f"{source}:savings"] = {**savings, "load_ms_saved": round(savings["load_ms_saved"], 1)}
+        return report
+
+scrape_metrics = ScrapeMetrics()
+
+class PageLoadTracker:
+    # Attach to a Page to Block Non-Essential Requests (Lean Mode) & Measure What Was Loaded
+    def __init__(self, source: str, lean: bool):
+        self.source = source
+        self.lean = lean
+        self.pages = 0
+        self.bytes_loaded = 0
+        self.load_ms = 0.0
+        self.blocked: Dict[str, int] = {}
+        self._sizing: Set[asyncio.Task] = set()
+
+    async def attach(self, page: Page) -> None:
+        page.on("requestfinished", self._on_request_finished)
+        if self.lean:
+            await page.route("**/*", self._route)
+
+    async def _route(self, route: Route) -> None:
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES:
+            reason = request.resource_type
+        elif is_blocked_host(request.url):
+            reason = "tracker"
+        else:
+            await route.continue_()
+            return
+        self.blocked[reason] = self.blocked.get(reason, 0) + 1
+        await route.abort()
+
+    def _on_request_finished(self, request: Request) -> None:
+        # Wire Sizes Cover Chunked & Compressed Bodies That Carry No Content-Length
+        task = asyncio.ensure_future(self._count_bytes(request))
+        self._sizing.add(task)
+        task.add_done_callback(self._sizing.discard)
+
+    async def _count_bytes(self, request: Request) -> None:
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return
+        self.bytes_loaded += max(0, sizes.get("responseBodySize", 0)) + max(0, sizes.get("responseHeadersSize", 0))
+
+    async def goto(self, page: Page, url: str, **kwargs: Any) -> Optional[Response]:
+        # Navigate & Time the Load
+        started_at = time.perf_counter()
+        try:
+            return await page.goto(url, **kwargs)
+        finally:
+            self.load_ms += (time.perf_counter() - started_at) * 1000
+            self.pages += 1
+
+    async def finish(self) -> Dict[str, Any]:
+        # Record This Scrape & Report Savings Against the Full-Mode Baseline When One Exists; Call Before the Page Closes
+        if self._sizing:
+            await asyncio.wait(set(self._sizing), timeout=2.0)
+        blocked_total = sum(self.blocked.values())
+        scrape_metrics.record(self.source, self.lean, self.pages, self.bytes_loaded, self.load_ms, blocked_total)
+        summary: Dict[str, Any] = {
+            "source": self.source,
+            "lean": self.lean,
+            "pages": self.pages,
+            "bytes_loaded": self.bytes_loaded,
+            "load_ms": round(self.load_ms, 1),
+            "requests_blocked": dict(self.blocked),
+            "bytes_saved": None,
+            "load_ms_saved": None
+        }
+
+        baseline = scrape_metrics.per_page(self.source, lean=False)
+        if self.lean and baseline and self.pages:
+            summary["bytes_saved"] = round(baseline["bytes_loaded"] * self.pages - self.bytes_loaded)
+            summary["load_ms_saved"] = round(baseline["load_ms"] * self.pages - self.load_ms, 1)
+            scrape_metrics.record_savings(summary)
+
+        if self.lean:
+            saved = (
+                f"saved ~{summary['bytes_saved'] / 1024:.0f} KB / {summary['load_ms_saved']:.0f} ms vs full mode"
+                if summary["bytes_saved"] is not None else "no full-mode baseline yet"
+            )
+            logger.info(
+                f"Lean {self.source} scrape: blocked {blocked_total} requests, loaded "
+                f"{self.bytes_loaded / 1024:.0f} KB in {self.load_ms:.0f} ms ({saved})"
+            )
+        return summary
+
+def lean_mode_enabled(source: str) -> bool:
+    # Lean Mode is On by Default; Each Source Can Opt Out
+    return settings.SCRAPING_LEAN_MODE and source not in settings.SCRAPING_LEAN_MODE_DISABLED_SOURCES
+
+def use_lean_mode(source: str) -> bool:
+    # Per-Page Choice: Lean Unless Baseline Sampling is Opted Into & This Load is Sampled in Full Mode;
+    # With Sampling On, a Source With no Baseline Yet Gets its First Page Sampled
+    if not lean_mode_enabled(source):
+        return False
+    rate = settings.SCRAPING_LEAN_BASELINE_SAMPLE_RATE
+    if rate <= 0:
+        return True
+    return scrape_metrics.per_page(source, lean=False) is not None and random.random() >= rate
@@ -0,0 +1,65 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+
+class TokenBucket:
+    # Async Token Bucket: Callers Queue for a Token Instead of Failing
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate = rate_per_second
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waits = 0
+        self.total_wait = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self) -> float:
+        # Wait Until a Token is Available; Returns Seconds Spent Waiting
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                delay = (1 - self.tokens) / self.rate
+                self.waits += 1
+                waited = delay
+                # Holding the Lock While Sleeping Keeps Queued Callers in FIFO Order
+                await asyncio.sleep(delay)
+                self._refill()
+            self.tokens -= 1
+        self.total_wait += waited
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "tokens_available": round(self.tokens, 2),
+            "rate_per_second": self.rate,
+            "capacity": self.capacity,
+            "waits": self.waits,
+            "total_wait_seconds": round(self.total_wait, 3)
+        }
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # Parse a Retry-After Header Given as Seconds or as an HTTP Date
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    # Full-Jitter Exponential Backoff
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
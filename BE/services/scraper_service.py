@@ -1,194 +1,324 @@
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlparse
-from playwright.async_api import async_playwright, Browser, Page
+from typing import Awaitable, Callable, List, Dict, Any, Optional
+from urllib.parse import urlencode
+from bs4 import BeautifulSoup
+from playwright.async_api import Page
 from core.config import settings
+from services.browser_pool import BrowserPool, browser_pool
+from services.single_flight import SingleFlight
+from services.admission import scrape_admission
+from services.http_client import http_client
+from services.host_scheduler import host_scheduler
+from services.lean_mode import PageLoadTracker, use_lean_mode
+from services.domain_utils import normalize_domain
 
 # Setup Logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Called With (page_num, companies) as Each Result Page Completes
+PageCallback = Callable[[int, List[Dict[str, Any]]], None]
+
+# Declarative Card Selectors per Source: Each Field is the Text (or Attribute) of the First Match Inside a Card
+YELLOW_PAGES_SOURCE: Dict[str, Any] = {
+    'card': '.v-card',
+    'fields': {
+        'website': {'selector': '.links a.track-visit-website', 'attribute': 'href'},
+        'company': {'selector': '.business-name span'},
+        'contact_phone': {'selector': '.phones'},
+        'street': {'selector': '.street-address'},
+        'locality': {'selector': '.locality'}
+    }
+}
+
+APOLLO_SOURCE: Dict[str, Any] = {
+    'card': '[data-testid="company-card"], .company-item',
+    'fields': {
+        'company': {'selector': 'h3, h4, .company-name, [data-testid="company-name"]'},
+        'industry': {'selector': '.industry, [data-testid="industry"]'},
+        'location': {'selector': '.location, [data-testid="location"]'},
+        'website': {'selector': 'a[href*="http"], .website-link', 'attribute': 'href'},
+        'linkedin_url': {'selector': 'a[href*="linkedin.com"]', 'attribute': 'href'}
+    }
+}
+
+# Runs in the Page: Maps Every Card to a {field: value} Dict Using the Selectors Above
+EXTRACT_CARDS_JS = """
+(cards, fields) => cards.map(card => {
+    const record = {};
+    for (const [name, spec] of Object.entries(fields)) {
+        const element = card.querySelector(spec.selector);
+        if (!element) {
+            record[name] = null;
+        } else {
+            record[name] = spec.attribute ? element.getAttribute(spec.attribute) : element.textContent;
+        }
+    }
+    return record;
+})
+"""
+
+def yellow_pages_url(industry: str, location: str, page_num: int = 1) -> str:
+    params = {'search_terms': industry, 'geo_location_terms': location}
+    if page_num > 1:
+        params['page'] = page_num
+    return f"{settings.YELLOW_PAGES_BASE_URL}/search?{urlencode(params)}"
+
+def apollo_search_url(industry: str, location: str, page_num: int) -> str:
+    return f"{settings.APOLLO_BASE_URL}/companies/search?{urlencode({'q': industry, 'location': location, 'page': page_num})}"
+
 class ScraperService:
-    def __init__(self):
-        self.browser: Optional[Browser] = None
+    def __init__(self, pool: BrowserPool = browser_pool):
+        self.pool = pool
     
     def get_domain(self, url: str) -> Optional[str]:
-        # Extract Domain From URL
+        # Extract Normalized Domain From URL (Lower-Cased, Without "www.")
+        return normalize_domain(url)
+    
+    async def extract_cards(self, page: Page, source: Dict[str, Any]) -> List[Dict[str, Optional[str]]]:
+        # Extract Every Card's Fields in One Browser Round Trip
+        return await page.eval_on_selector_all(source['card'], EXTRACT_CARDS_JS, source['fields'])
+    
+    def parse_yellow_pages_card(self, raw: Dict[str, Optional[str]], industry: str) -> Optional[Dict[str, Any]]:
+        # Normalize One Raw Yellow Pages Card; Cards Without a Website are Skipped
+        website_url = raw.get('website')
+        if not website_url:
+            return None
+        
+        company_name = (raw.get('company') or '').strip() or 'N/A'
+        contact_phone = (raw.get('contact_phone') or '').strip() or 'N/A'
+        
+        # Combine Street Address & Locality
+        address1 = (raw.get('street') or '').strip() or 'N/A'
+        address2 = (raw.get('locality') or '').strip() or 'N/A'
+        location_full = f"{address1} {address2}".strip()
+        
+        return {
+            'company': company_name,
+            'contact_phone': contact_phone,
+            'location': location_full,
+            'website': website_url,
+            'domain': self.get_domain(website_url),
+            'industry': industry
+        }
+    
+    def parse_apollo_card(self, raw: Dict[str, Optional[str]], industry: str) -> Dict[str, Any]:
+        # Normalize One Raw Apollo Company Card
+        return {
+            'company': (raw.get('company') or '').strip() or 'Unknown Company',
+            'industry': (raw.get('industry') or '').strip() or industry,
+            'location': (raw.get('location') or '').strip() or 'Unknown',
+            'website': raw.get('website') or 'N/A',
+            'linkedin_url': raw.get('linkedin_url') or 'N/A'
+        }
+    
+    def extract_cards_from_html(self, html: str, source: Dict[str, Any]) -> List[Dict[str, Optional[str]]]:
+        # Static Counterpart of EXTRACT_CARDS_JS: Same Declarative Selectors, Parsed With lxml
+        soup = BeautifulSoup(html, 'lxml')
+        records = []
+        for card in soup.select(source['card']):
+            record: Dict[str, Optional[str]] = {}
+            for name, spec in source['fields'].items():
+                element = card.select_one(spec['selector'])
+                if element is None:
+                    record[name] = None
+                elif spec.get('attribute'):
+                    record[name] = element.get(spec['attribute'])
+                else:
+                    record[name] = element.get_text()
+            records.append(record)
+        return records
+    
+    async def _scrape_pages(
+        self,
+        scrape_page: Callable[[int], Awaitable[List[Dict[str, Any]]]],
+        max_pages: int,
+        on_page: Optional[PageCallback]
+    ) -> List[List[Dict[str, Any]]]:
+        # Scrape Pages 1..N Concurrently, Reporting Each Page as Soon as it Finishes;
+        # a Failed Page is Logged & Skipped, and Only a Scrape Where Every Page Failed Raises
+        async def run(page_num: int) -> List[Dict[str, Any]]:
+            companies = await scrape_page(page_num)
+            if on_page:
+                on_page(page_num, companies)
+            return companies
+        
+        results = await asyncio.gather(*(run(page_num) for page_num in range(1, max_pages + 1)), return_exceptions=True)
+        pages: List[List[Dict[str, Any]]] = []
+        errors: List[Exception] = []
+        for page_num, result in enumerate(results, start=1):
+            if isinstance(result, Exception):
+                logger.warning(f'Page {page_num} failed, keeping the other pages: {str(result)}')
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                pages.append(result)
+        
+        if errors and not pages:
+            raise errors[0]
+        return pages
+    
+    async def scrape_yellow_pages(
+        self,
+        industry: str,
+        location: str,
+        max_pages: int = 1,
+        on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        # Scrape Yellow Pages Result Pages Concurrently & Concatenate Them in Page Order
+        pages = await self._scrape_pages(
+            lambda page_num: self.scrape_yellow_pages_page(industry, location, page_num), max_pages, on_page
+        )
+        companies = [company for page in pages for company in page]
+        logger.info(f'Scraped {len(companies)} companies from {max_pages} Yellow Pages page(s)')
+        return companies
+    
+    async def scrape_yellow_pages_page(self, industry: str, location: str, page_num: int = 1) -> List[Dict[str, Any]]:
+        # Scrape One Results Page: Plain HTTP First, Headless Chromium Only if That Finds No Cards
+        url = yellow_pages_url(industry, location, page_num)
+        async with host_scheduler.slot(url):
+            if settings.YELLOW_PAGES_STATIC_FIRST:
+                companies = await self.scrape_yellow_pages_static(url, industry)
+                if companies is not None:
+                    return companies
+            return await self.scrape_yellow_pages_browser(url, industry)
+    
+    async def scrape_yellow_pages_static(self, url: str, industry: str) -> Optional[List[Dict[str, Any]]]:
+        # Fetch the Results Page Over HTTP & Parse it; Returns None When the Browser is Needed
         try:
-            parsed = urlparse(url)
-            return parsed.netlify if parsed.netlify else parsed.hostname
-        except:
+            client = await http_client.get_client()
+            response = await client.get(url)
+            response.raise_for_status()
+            raw_cards = await asyncio.to_thread(self.extract_cards_from_html, response.text, YELLOW_PAGES_SOURCE)
+        except Exception as e:
+            logger.info(f'Yellow Pages static fetch failed, falling back to browser: {str(e)}')
+            return None
+        
+        if not raw_cards:
+            logger.info('Yellow Pages static parse found no cards, falling back to browser')
             return None
+        
+        companies = []
+        for raw in raw_cards:
+            try:
+                company = self.parse_yellow_pages_card(raw, industry)
+                if company:
+                    companies.append(company)
+            except Exception as e:
+                logger.warning(f'Error parsing company card: {str(e)}')
+                continue
+        
+        return companies
     
-    async def scrape_yellow_pages(self, industry: str, location: str) -> List[Dict[str, Any]]:
-        # Scrape Yellow Pages for Companies
+    async def scrape_yellow_pages_browser(self, url: str, industry: str) -> List[Dict[str, Any]]:
+        # Scrape One Yellow Pages Results Page Using Headless Chromium
         companies = []
         
-        async with async_playwright() as p:
-            # Launch Browser
-            browser = await p.chromium.launch(
-                headless=True,  # Set to False for Debugging
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox', 
-                    '--disable-dev-shm-usage'
-                ] if settings.SCRAPING_DELAY > 0 else []
-            )
-            
+        # Lease an Isolated Context From the Shared Browser
+        async with self.pool.context() as pooled:
+            tracker = PageLoadTracker('yellowpages', use_lean_mode('yellowpages'))
             try:
-                page = await browser.new_page()
+                page = await pooled.new_page()
+                await tracker.attach(page)
                 
                 # Navigate to Yellow Pages Search
-                url = f"https://www.yellowpages.com/search?search_terms={industry}&geo_location_terms={location}"
-                await page.goto(url, wait_until='domcontentloaded')
+                await tracker.goto(page, url, wait_until='domcontentloaded')
                 
                 # Wait for Results to Load
                 await page.wait_for_selector('.search-results.organic', state='attached', timeout=12000)
                 
                 # Get All Company Cards
-                company_cards = await page.query_selector_all('.v-card')
-                
-                for card in company_cards:
+                for raw in await self.extract_cards(page, YELLOW_PAGES_SOURCE):
                     try:
-                        # Extract Website URL
-                        website_element = await card.query_selector('.links a.track-visit-website')
-                        website_url = await website_element.get_attribute('href') if website_element else None
-                        
-                        if not website_url:
-                            continue
-                            
-                        # Extract Company Name
-                        name_element = await card.query_selector('.business-name span')
-                        company_name = await name_element.text_content() if name_element else 'N/A'
-                        company_name = company_name.strip() if company_name else 'N/A'
-                        
-                        # Extract Phone
-                        phone_element = await card.query_selector('.phones')
-                        contact_phone = await phone_element.text_content() if phone_element else 'N/A'
-                        contact_phone = contact_phone.strip() if contact_phone else 'N/A'
-                        
-                        # Extract Address
-                        street_element = await card.query_selector('.street-address')
-                        locality_element = await card.query_selector('.locality')
-                        
-                        address1 = await street_element.text_content() if street_element else 'N/A'
-                        address2 = await locality_element.text_content() if locality_element else 'N/A'
-                        
-                        address1 = address1.strip() if address1 else 'N/A'
-                        address2 = address2.strip() if address2 else 'N/A'
-                        
-                        location_full = f"{address1} {address2}".strip()
-                        
-                        # Extract Domain
-                        domain = self.get_domain(website_url) if website_url else None
-                        
-                        companies.append({
-                            'company': company_name,
-                            'contact_phone': contact_phone,
-                            'location': location_full,
-                            'website': website_url,
-                            'domain': domain,
-                            'industry': industry 
-                        })
-                        
+                        company = self.parse_yellow_pages_card(raw, industry)
+                        if company:
+                            companies.append(company)
                     except Exception as e:
                         logger.warning(f'Error parsing company card: {str(e)}')
                         continue
                         
             except Exception as e:
                 logger.error(f'Scraping failed: {str(e)}')
-                
-            finally:
-                await browser.close()
+            
+            await tracker.finish()
         
-        logger.info(f'Scraped {len(companies)} companies from Yellow Pages')
         return companies
     
-    async def scrape_apollo_companies(self, industry: str, location: str = "", max_pages: int = 2) -> List[Dict[str, Any]]:
+    async def scrape_apollo_companies(
+        self,
+        industry: str,
+        location: str = "",
+        max_pages: int = 2,
+        on_page: Optional[PageCallback] = None
+    ) -> List[Dict[str, Any]]:
+        # Scrape Apollo Result Pages Concurrently & Concatenate Them in Page Order
+        pages = await self._scrape_pages(
+            lambda page_num: self.scrape_apollo_page(industry, location, page_num), max_pages, on_page
+        )
+        companies = [company for page in pages for company in page]
+        logger.info(f'Scraped {len(companies)} companies from Apollo.io')
+        return companies
+    
+    async def scrape_apollo_page(self, industry: str, location: str, page_num: int) -> List[Dict[str, Any]]:
+        # Scrape One Apollo Results Page in its Own Pooled Context
         companies = []
+        url = apollo_search_url(industry, location, page_num)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage']
-            )
-            
+        async with host_scheduler.slot(url), self.pool.context() as pooled:
+            tracker = PageLoadTracker('apollo', use_lean_mode('apollo'))
             try:
-                page = await browser.new_page()
+                page = await pooled.new_page()
+                await tracker.attach(page)
                 
                 # Set User Agent
                 await page.set_extra_http_headers({
                     'User-Agent': settings.USER_AGENT
                 })
                 
-                for page_num in range(1, max_pages + 1):
+                await tracker.goto(page, url, wait_until='domcontentloaded')
+                
+                # Wait for Company Listings 
+                await page.wait_for_selector(APOLLO_SOURCE['card'], timeout=10000)
+                
+                # Extract Company Data
+                for raw in await self.extract_cards(page, APOLLO_SOURCE):
                     try:
-                        # Construct Apollo Search URL 
-                        url = f"https://app.apollo.io/companies/search?q={industry}&location={location}&page={page_num}"
-                        await page.goto(url, wait_until='domcontentloaded')
-                        
-                        # Wait for Company Listings 
-                        await page.wait_for_selector('[data-testid="company-card"], .company-item', timeout=10000)
-                        
-                        # Extract Company Data
-                        company_cards = await page.query_selector_all('[data-testid="company-card"], .company-item')
-                        
-                        for card in company_cards:
-                            try:
-                                # Extract Company Name
-                                name_element = await card.query_selector('h3, h4, .company-name, [data-testid="company-name"]')
-                                company_name = await name_element.text_content() if name_element else 'Unknown Company'
-                                
-                                # Extract Industry
-                                industry_element = await card.query_selector('.industry, [data-testid="industry"]')
-                                company_industry = await industry_element.text_content() if industry_element else industry
-                                
-                                # Extract Location
-                                location_element = await card.query_selector('.location, [data-testid="location"]')
-                                company_location = await location_element.text_content() if location_element else 'Unknown'
-                                
-                                # Extract Website
-                                website_element = await card.query_selector('a[href*="http"], .website-link')
-                                website_url = await website_element.get_attribute('href') if website_element else 'N/A'
-                                
-                                # Extract LinkedIn
-                                linkedin_element = await card.query_selector('a[href*="linkedin.com"]')
-                                linkedin_url = await linkedin_element.get_attribute('href') if linkedin_element else 'N/A'
-                                
-                                companies.append({
-                                    'company': company_name.strip() if company_name else 'Unknown Company',
-                                    'industry': company_industry.strip() if company_industry else industry,
-                                    'location': company_location.strip() if company_location else 'Unknown',
-                                    'website': website_url,
-                                    'linkedin_url': linkedin_url
-                                })
-                                
-                            except Exception as e:
-                                logger.warning(f'Error parsing Apollo company card: {str(e)}')
-                                continue
-                        
-                        # Respectful Delay Between Pages
-                        await asyncio.sleep(settings.SCRAPING_DELAY)
-                        
+                        companies.append(self.parse_apollo_card(raw, industry))
                     except Exception as e:
-                        logger.error(f'Error scraping Apollo page {page_num}: {str(e)}')
+                        logger.warning(f'Error parsing Apollo company card: {str(e)}')
                         continue
-                        
-            except Exception as e:
-                logger.error(f'Apollo scraping failed: {str(e)}')
                 
-            finally:
-                await browser.close()
+            except Exception as e:
+                logger.error(f'Error scraping Apollo page {page_num}: {str(e)}')
+            
+            await tracker.finish()
         
-        logger.info(f'Scraped {len(companies)} companies from Apollo.io')
         return companies
 
+# Identical Concurrent Scrapes Share One Browser Run
+scrape_single_flight = SingleFlight()
+
+def _scrape_key(source: str, *parts: Any) -> tuple:
+    return (source, *(" ".join(str(part).lower().split()) for part in parts))
+
+async def _admitted(scrape: Callable[[], Awaitable[List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    # Run a Scrape Under Global Admission Control; Raises AdmissionRejectedError When Overloaded
+    async with scrape_admission.admit():
+        return await scrape()
+
 # Convenience Functions
-async def scrape_yellow_pages_companies(industry: str, location: str) -> List[Dict[str, Any]]:
+async def scrape_yellow_pages_companies(industry: str, location: str, max_pages: int = 1) -> List[Dict[str, Any]]:
     scraper = ScraperService()
-    return await scraper.scrape_yellow_pages(industry, location)
+    return await scrape_single_flight.do(
+        _scrape_key("yellowpages", industry, location, max_pages),
+        lambda: _admitted(lambda: scraper.scrape_yellow_pages(industry, location, max_pages))
+    )
 
 async def scrape_apollo_companies(industry: str, location: str = "", max_pages: int = 2) -> List[Dict[str, Any]]:
     scraper = ScraperService()
-    return await scraper.scrape_apollo_companies(industry, location, max_pages)
\ No newline at end of file
+    return await scrape_single_flight.do(
+        _scrape_key("apollo", industry, location, max_pages),
+        lambda: _admitted(lambda: scraper.scrape_apollo_companies(industry, location, max_pages))
+    )
\ No newline at end of file
@@ -0,0 +1,147 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Expired Disk Rows are Swept at Most This Often, Not on Every Write
+PURGE_INTERVAL = 60.0
+
+class SearchCache:
+    # Two-Tier TTL Cache for Apollo Search Responses: In-Memory LRU + Optional SQLite
+    def __init__(self, max_entries: int, ttl_seconds: float, db_path: str = ""):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._last_purge = 0.0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if db_path:
+            self._open_db()
+
+    def _open_db(self) -> None:
+        # Open the On-Disk Tier so Cached Searches Survive Restarts
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_expires_at ON search_cache (expires_at)")
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Search cache disk tier disabled: {str(e)}")
+            self._db = None
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        # Build a Stable Key From the Normalized Request Payload
+        def normalize(value: Any) -> Any:
+            if isinstance(value, str):
+                return " ".join(value.lower().split())
+            if isinstance(value, list):
+                return [normalize(item) for item in value]
+            if isinstance(value, dict):
+                return {key: normalize(item) for key, item in value.items()}
+            return value
+
+        encoded = json.dumps(normalize(payload), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        # Look Up a Response in Memory First, Then on Disk
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._memory[key]
+
+        if self._db is not None:
+            row = await asyncio.to_thread(self._db_get, key)
+            if row is not None and row[1] > now:
+                value = json.loads(row[0])
+                self._remember(key, value, row[1])
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        # Store a Response in Both Tiers
+        expires_at = time.time() + self.ttl_seconds
+        self._remember(key, value, expires_at)
+        if self._db is not None:
+            await asyncio.to_thread(self._db_set, key, json.dumps(value), expires_at)
+
+    def _remember(self, key: str, value: Dict[str, Any], expires_at: float) -> None:
+        # Insert Into the LRU Tier, Evicting the Least Recently Used Entry When Full
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _db_get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._db_lock:
+            try:
+                return self._db.execute(
+                    "SELECT value, expires_at FROM search_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Search cache disk read failed: {str(e)}")
+                return None
+
+    def _db_set(self, key: str, value: str, expires_at: float) -> None:
+        with self._db_lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO search_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at)
+                )
+                now = time.time()
+                if now - self._last_purge >= PURGE_INTERVAL:
+                    self._db.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+                    self._last_purge = now
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Search cache disk write failed: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        # Report Hit/Miss Counters & Tier Sizes
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_enabled": self._db is not None
+        }
+
+# Initialize Shared Search Cache
+search_cache = SearchCache(
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SEARCH_CACHE_TTL,
+    db_path=settings.SEARCH_CACHE_DB_PATH
+) if settings.SEARCH_CACHE_ENABLED else None
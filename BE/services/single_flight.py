@@ -0,0 +1,44 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+# Seconds the Last Caller Waits for Abandoned Work to Unwind After Cancelling it
+CANCEL_GRACE = 5.0
+
+class SingleFlight:
+    # Coalesce Concurrent Identical Calls Into One Shared In-Flight Task
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+        self.shared = 0
+        self.abandoned = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        # Run the Call Once per Key; Callers Arriving Meanwhile Await the Same Result
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+
+        # Shield so One Caller Disconnecting Does Not Cancel the Work for the Others,
+        # but Cancel it Once the Last Caller Has Left so it Stops Holding Slots & Browser Contexts
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    task.cancel()
+                    self.abandoned += 1
+                    await asyncio.wait({task}, timeout=CANCEL_GRACE)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": len(self._in_flight), "shared": self.shared, "abandoned": self.abandoned}
@@ -0,0 +1,184 @@
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Dict, Any, Iterable, Iterator, List, Optional
+from pydantic import ValidationError
+from models.schemas import Lead
+from services.data_transformer import LEADS_ADAPTER, DataTransformer, batch_uuid4
+
+def split_location(location: Optional[str]) -> str:
+    # "City, State[, ...]" -> "City, State" in a Single Split; Anything Without a Comma is Kept Whole
+    if not location:
+        return ""
+    parts = location.split(",", 2)
+    city = parts[0].strip()
+    state = parts[1].strip() if len(parts) > 1 else ""
+    return f"{city}, {state}".strip(", ")
+
+class SourceAdapter(ABC):
+    # Maps One Raw Record of a Source Straight to Lead Fields
+    source = ""
+
+    @abstractmethod
+    def fields(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        ...
+
+class ApolloAPIAdapter(SourceAdapter):
+    # Records are {"organization": ..., "person": ...} as Yielded by ApolloAPIClient.iter_companies,
+    # Plus Optional Ranked "contacts" When the Caller Resolved Them
+    source = "apollo_api"
+
+    def fields(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        organization = record.get("organization", {})
+        employee_count = organization.get("estimated_num_employees", 0)
+        industry = organization.get("industry", "")
+        return {
+            "company": organization.get("name", "Unknown Company"),
+            "industry": industry,
+            "location": f"{organization.get('city', '')}, {organization.get('state', '')}".strip(", "),
+            "website": organization.get("website_url", "N/A"),
+            "linkedinUrl": organization.get("linkedin_url", "N/A"),
+            "contact": DataTransformer.format_contact(
+                organization.get("primary_phone", {}).get("number", ""), record.get("person") or {}
+            ),
+            "employees": str(employee_count) if employee_count else "Unknown",
+            "priority": DataTransformer.get_priority_from_employee_count(employee_count),
+            "outreachAngle": DataTransformer.get_outreach_angle_from_industry(industry),
+            "contacts": record.get("contacts")
+        }
+
+class ApolloScrapeAdapter(SourceAdapter):
+    # Company Cards Scraped From the Apollo Web App
+    source = "apollo"
+
+    def fields(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        industry = record.get("industry", "Unknown")
+        return {
+            "company": record.get("company", "Unknown Company"),
+            "industry": industry,
+            "location": split_location(record.get("location")),
+            "website": record.get("website", "N/A"),
+            "linkedinUrl": record.get("linkedin_url", "N/A"),
+            "contact": "Contact Not Available",
+            "employees": "Unknown",
+            "priority": DataTransformer.get_priority_from_employee_count(0),
+            "outreachAngle": DataTransformer.get_outreach_angle_from_industry(industry)
+        }
+
+class YellowPagesAdapter(SourceAdapter):
+    # Listing Cards Scraped From Yellow Pages; the Listed Phone Becomes the Contact
+    source = "yellowpages"
+
+    def fields(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        industry = record.get("industry", "Unknown")
+        phone = record.get("contact_phone", "N/A")
+        return {
+            "company": record.get("company", "Unknown Company"),
+            "industry": industry,
+            "location": split_location(record.get("location")),
+            "website": record.get("website", "N/A"),
+            "linkedinUrl": "N/A",
+            "contact": f"Phone: {phone}" if phone and phone != "N/A" else "Contact Not Available",
+            "employees": "Unknown",
+            "priority": DataTransformer.get_priority_from_employee_count(0),
+            "outreachAngle": DataTransformer.get_outreach_angle_from_industry(industry)
+        }
+
+class PipelineMetrics:
+    # Per-Source Counters for the Normalization Stage; Time Covers Mapping Only, Not Waiting on Upstream
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, float]] = {}
+
+    def record(self, source: str, records: int, leads: int, errors: int, seconds: float) -> None:
+        totals = self._totals.setdefault(source, {"records": 0, "leads": 0, "errors": 0, "seconds": 0.0})
+        totals["records"] += records
+        totals["leads"] += leads
+        totals["errors"] += errors
+        totals["seconds"] += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            source: {
+                "records": int(totals["records"]),
+                "leads": int(totals["leads"]),
+                "errors": int(totals["errors"]),
+                "records_per_second": round(totals["records"] / totals["seconds"]) if totals["seconds"] else 0
+            }
+            for source, totals in self._totals.items()
+        }
+
+# Initialize Shared Adapters & Metrics
+ADAPTERS: Dict[str, SourceAdapter] = {
+    adapter.source: adapter for adapter in (ApolloAPIAdapter(), ApolloScrapeAdapter(), YellowPagesAdapter())
+}
+pipeline_metrics = PipelineMetrics()
+
+def get_adapter(source: str) -> SourceAdapter:
+    adapter = ADAPTERS.get(source)
+    if adapter is None:
+        raise ValueError(f"No source adapter registered for '{source}'")
+    return adapter
+
+def _to_lead(adapter: SourceAdapter, record: Dict[str, Any], last_updated: str) -> Lead:
+    return Lead(id=str(uuid.uuid4()), lastUpdated=last_updated, **adapter.fields(record))
+
+def normalize(records: Iterable[Dict[str, Any]], source: str) -> Iterator[Lead]:
+    # Streaming Stage: Yield One Lead per Raw Record; Records That Fail to Map are Counted & Skipped
+    adapter = get_adapter(source)
+    last_updated = datetime.now().strftime("%Y-%m-%d")
+    for record in records:
+        started = time.perf_counter()
+        try:
+            lead = _to_lead(adapter, record, last_updated)
+        except Exception:
+            pipeline_metrics.record(source, 1, 0, 1, time.perf_counter() - started)
+            continue
+        pipeline_metrics.record(source, 1, 1, 0, time.perf_counter() - started)
+        yield lead
+
+async def normalize_stream(records: AsyncIterable[Dict[str, Any]], source: str) -> AsyncIterator[Lead]:
+    # Async Counterpart of normalize() for Paged/Streamed Sources
+    adapter = get_adapter(source)
+    last_updated = datetime.now().strftime("%Y-%m-%d")
+    async for record in records:
+        started = time.perf_counter()
+        try:
+            lead = _to_lead(adapter, record, last_updated)
+        except Exception:
+            pipeline_metrics.record(source, 1, 0, 1, time.perf_counter() - started)
+            continue
+        pipeline_metrics.record(source, 1, 1, 0, time.perf_counter() - started)
+        yield lead
+
+def normalize_all(records: Iterable[Dict[str, Any]], source: str) -> List[Lead]:
+    # Batch Stage for a Whole Page: Map Every Record, Then Share One Date, One Random Draw for the IDs
+    # & One pydantic-core Validation Call; Failing Records are Counted & Skipped as in normalize()
+    adapter = get_adapter(source)
+    started = time.perf_counter()
+    rows: List[Dict[str, Any]] = []
+    count = errors = 0
+    for record in records:
+        count += 1
+        try:
+            rows.append(adapter.fields(record))
+        except Exception:
+            errors += 1
+
+    last_updated = datetime.now().strftime("%Y-%m-%d")
+    for lead_id, row in zip(batch_uuid4(len(rows)), rows):
+        row["id"] = lead_id
+        row["lastUpdated"] = last_updated
+    try:
+        leads = LEADS_ADAPTER.validate_python(rows)
+    except ValidationError:
+        # One Bad Row Fails the Batch Call: Validate Row by Row so Only the Bad Ones are Dropped
+        leads = []
+        for row in rows:
+            try:
+                leads.append(Lead.model_validate(row))
+            except ValidationError:
+                errors += 1
+
+    pipeline_metrics.record(source, count, len(leads), errors, time.perf_counter() - started)
+    return leads
@@ -0,0 +1,129 @@
+import bisect
+import heapq
+import math
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Okapi BM25 Parameters (Same Defaults as SQLite FTS5)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+def fold(text: str) -> str:
+    # Case & Diacritic Folding to Match FTS5's unicode61 remove_diacritics 2 ("Café" -> "cafe")
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return TOKEN_PATTERN.findall(fold(text or ""))
+
+def fts5_query(query: str) -> Optional[str]:
+    # User Text -> Safe FTS5 MATCH Expression: Every Term Required, the Last One as a Prefix
+    terms = tokenize(query)
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " AND ".join(quoted)
+
+def make_snippet(text: Optional[str], query: str, width: int = 10) -> Optional[str]:
+    # Up to `width` Words Around the First Query Match, Matches Wrapped in [brackets] Like the FTS5 Snippets
+    words = (text or "").split()
+    terms = tokenize(query)
+    if not words or not terms:
+        return None
+
+    def matches(word: str) -> bool:
+        tokens = tokenize(word)
+        return any(token == term or (index == len(terms) - 1 and token.startswith(term)) for token in tokens for index, term in enumerate(terms))
+
+    hits = [index for index, word in enumerate(words) if matches(word)]
+    if not hits:
+        return None
+    start = max(0, min(hits[0] - width // 2, len(words) - width))
+    window = [f"[{word}]" if matches(word) else word for word in words[start:start + width]]
+    return ("…" if start > 0 else "") + " ".join(window) + ("…" if start + width < len(words) else "")
+
+class InvertedIndex:
+    # In-Process BM25 Index Updated One Document at a Time; Mirrors the FTS5 Query Semantics Above
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._vocabulary: List[str] = []
+        self._doc_terms: Dict[str, Dict[str, int]] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def remove(self, doc_key: str) -> None:
+        terms = self._doc_terms.pop(doc_key, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            postings.pop(doc_key, None)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary.pop(bisect.bisect_left(self._vocabulary, term))
+        self._total_length -= self._doc_lengths.pop(doc_key)
+
+    def add(self, doc_key: str, text: str) -> None:
+        # Replaces Any Earlier Version of the Document
+        self.remove(doc_key)
+        tokens = tokenize(text)
+        terms: Dict[str, int] = {}
+        for token in tokens:
+            terms[token] = terms.get(token, 0) + 1
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._vocabulary, term)
+            postings[doc_key] = frequency
+        self._doc_terms[doc_key] = terms
+        self._doc_lengths[doc_key] = len(tokens)
+        self._total_length += len(tokens)
+
+    def _expand(self, prefix: str) -> List[str]:
+        # Vocabulary Terms Starting With `prefix`, Found by Bisection
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\U0010ffff")
+        return self._vocabulary[start:end]
+
+    def search(self, query: str, limit: int, offset: int = 0) -> List[Tuple[str, float]]:
+        # (doc_key, score) Best First; Every Query Term Must Match, the Last One by Prefix
+        terms = tokenize(query)
+        if not terms or not self._doc_terms:
+            return []
+        groups = [[term] for term in terms[:-1]] + [self._expand(terms[-1])]
+        doc_count = len(self._doc_terms)
+        average_length = self._total_length / doc_count or 1.0
+
+        # Start From the Rarest Term Group so the Candidate Set is as Small as Possible
+        group_postings = sorted(
+            ([self._postings[term] for term in group if term in self._postings] for group in groups),
+            key=lambda postings: sum(len(p) for p in postings)
+        )
+        if any(not postings for postings in group_postings):
+            return []
+        candidates = set().union(*group_postings[0])
+        for postings in group_postings[1:]:
+            candidates = {doc for doc in candidates if any(doc in p for p in postings)}
+            if not candidates:
+                return []
+
+        scores: Dict[str, float] = {}
+        for postings in group_postings:
+            for posting in postings:
+                idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                # Walk Whichever Side is Smaller
+                docs = candidates if len(candidates) < len(posting) else (doc for doc in posting if doc in candidates)
+                for doc in docs:
+                    frequency = posting.get(doc)
+                    if frequency:
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths[doc] / average_length)
+                        scores[doc] = scores.get(doc, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        return heapq.nlargest(offset + limit, scores.items(), key=lambda item: item[1])[offset:]
@@ -0,0 +1,95 @@
+import asyncio
+import httpx
+import pytest
+from fastapi import HTTPException
+from core.config import settings
+from services import circuit_breaker as circuit_breaker_module
+from services.apollo_client import ApolloAPIClient
+from services.circuit_breaker import CircuitBreaker
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module.time, "monotonic", fake)
+    return fake
+
+def test_opens_after_threshold_failures(clock):
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=30)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    assert breaker.rejected == 1
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_half_open_admits_one_probe_then_closes_on_success(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+def test_failed_probe_reopens_for_a_full_cool_down(clock):
+    breaker = CircuitBreaker("test", failure_threshold=5, reset_timeout=30)
+    for _ in range(5):
+        breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 29
+    assert not breaker.allow_request()
+    clock.now += 1
+    assert breaker.allow_request()
+
+def make_client(handler) -> ApolloAPIClient:
+    client = ApolloAPIClient("test-key")
+    client.client = httpx.AsyncClient(base_url="http://apollo.test", transport=httpx.MockTransport(handler))
+    client.circuit_breaker = CircuitBreaker("apollo", failure_threshold=1, reset_timeout=0)
+    client.circuit_breaker.record_failure()
+    return client
+
+def test_non_json_probe_does_not_wedge_half_open(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_RETRIES", 0)
+    responses = [httpx.Response(200, text="<html>maintenance</html>"), httpx.Response(200, json={"ok": True})]
+    client = make_client(lambda request: responses.pop(0))
+
+    async def scenario():
+        assert client.circuit_breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(ValueError):
+            await client._post("/organizations/search", {})
+        # reset_timeout=0: Immediately Half-Open Again, and a Healthy Apollo Closes the Circuit
+        assert await client._post("/organizations/search", {}) == {"ok": True}
+        assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())
+
+def test_client_errors_close_a_half_open_circuit(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_RETRIES", 0)
+    client = make_client(lambda request: httpx.Response(422, json={"error": "bad payload"}))
+
+    async def scenario():
+        with pytest.raises(HTTPException):
+            await client._post("/organizations/search", {})
+        assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())
@@ -0,0 +1,76 @@
+import asyncio
+import random
+import string
+import time
+from models.schemas import Lead
+from services import dedup_service
+from services.dedup_service import LeadDeduplicator, normalize_company_name
+
+def make_lead(lead_id: str, company: str, website: str = "N/A", contact: str = "Contact Not Available") -> Lead:
+    return Lead(id=lead_id, company=company, industry="Restaurants", location="Austin, TX", website=website, contact=contact)
+
+def test_apostrophes_are_dropped_not_spaced():
+    assert normalize_company_name("Joe's Pizza") == normalize_company_name("Joes Pizza LLC") == "joes pizza"
+    assert normalize_company_name("Joe’s Pizza, Inc.") == "joes pizza"
+
+def test_same_name_merges_across_sources():
+    leads = LeadDeduplicator().dedupe({
+        "apollo_api": [make_lead("a", "Joe's Pizza")],
+        "yellowpages": [make_lead("b", "Joes Pizza LLC", website="https://www.joespizza.test", contact="Phone: 555-0100")]
+    })
+    assert len(leads) == 1
+    assert leads[0].website == "https://www.joespizza.test"
+    assert leads[0].contact == "Phone: 555-0100"
+    assert [(record.source, record.matchedBy) for record in leads[0].sourceRecords] == [("apollo_api", None), ("yellowpages", "name")]
+
+def test_same_domain_merges_and_different_domains_stay_apart():
+    deduplicator = LeadDeduplicator()
+    leads = deduplicator.dedupe({
+        "apollo_api": [make_lead("a", "Acme Plumbing", website="https://acme.test"), make_lead("b", "Acme Plumbing", website="https://other.test")],
+        "yellowpages": [make_lead("c", "ACME Plumbing & Heating", website="http://www.acme.test/contact")]
+    })
+    assert [lead.id for lead in leads] == ["a", "b"]
+    assert deduplicator.domain_merges == 1
+
+def test_shared_word_does_not_make_dedup_quadratic():
+    # Thousands of Distinct "... Pizza" Names Must Neither Merge Nor Compare Against Each Other
+    rng = random.Random(7)
+    names = {"".join(rng.choices(string.ascii_lowercase, k=8)).title() for _ in range(3000)}
+    leads = [make_lead(str(index), f"{name} Pizza") for index, name in enumerate(sorted(names))]
+    compared = []
+    original = dedup_service.jaccard
+
+    def counting_jaccard(left, right):
+        compared.append(1)
+        return original(left, right)
+
+    dedup_service.jaccard = counting_jaccard
+    try:
+        started = time.perf_counter()
+        result = LeadDeduplicator().dedupe({"yellowpages": leads})
+        elapsed = time.perf_counter() - started
+    finally:
+        dedup_service.jaccard = original
+    assert len(result) >= len(leads) - 10
+    assert len(compared) <= len(leads) * dedup_service.MINHASH_BANDS * dedup_service.MAX_BUCKET_SIZE
+    assert elapsed < 10
+
+def test_large_batches_run_in_a_worker_thread(monkeypatch):
+    deduplicator = LeadDeduplicator()
+    original = deduplicator.dedupe
+    on_loop = []
+
+    def recording_dedupe(leads_by_source):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return original(leads_by_source)
+
+    monkeypatch.setattr(deduplicator, "dedupe", recording_dedupe)
+    monkeypatch.setattr(dedup_service, "DEDUP_THREAD_THRESHOLD", 1)
+    leads = [make_lead("a", "Alpha Dental"), make_lead("b", "Beta Dental")]
+    asyncio.run(deduplicator.dedupe_async({"yellowpages": leads}))
+    asyncio.run(deduplicator.dedupe_async({"yellowpages": leads[:1]}))
+    assert on_loop == [False, True]
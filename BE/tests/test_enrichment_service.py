@@ -0,0 +1,65 @@
+import asyncio
+from services import enrichment_service as enrichment_module
+from services.enrichment_service import EnrichmentService
+
+HTML = b"<html><body><a href='mailto:sales@lead.test'>Email</a></body></html>"
+
+async def serve_html(reader, writer):
+    await reader.readuntil(b"\r\n\r\n")
+    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\nContent-Length: %d\r\n\r\n%s" % (len(HTML), HTML))
+    await writer.drain()
+    writer.close()
+
+def test_internal_addresses_are_refused():
+    service = EnrichmentService()
+
+    async def scenario():
+        try:
+            return await service._fetch("http://127.0.0.1:9/")
+        finally:
+            await service.close()
+
+    assert asyncio.run(scenario()) is None
+    assert service.blocked_urls == 1
+
+def test_connection_goes_to_the_checked_address(monkeypatch):
+    # "lead.test" Does Not Resolve: the Page Only Loads if the Transport Dials the Checked Address
+    checked = []
+
+    async def resolve(host, port):
+        checked.append(host)
+        return "127.0.0.1"
+
+    monkeypatch.setattr(enrichment_module, "resolve_public_address", resolve)
+    service = EnrichmentService()
+
+    async def scenario():
+        server = await asyncio.start_server(serve_html, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with server:
+                return await service._fetch(f"http://lead.test:{port}/")
+        finally:
+            await service.close()
+
+    final_url, html = asyncio.run(scenario())
+    assert checked == ["lead.test"]
+    assert "sales@lead.test" in html
+
+def test_concurrent_enrichments_share_one_crawl(monkeypatch):
+    service = EnrichmentService()
+    fetched = []
+
+    async def fetch(url):
+        fetched.append(url)
+        await asyncio.sleep(0.01)
+        return url, HTML.decode()
+
+    monkeypatch.setattr(service, "_fetch", fetch)
+
+    async def scenario():
+        return await asyncio.gather(*(service.crawl_domain("lead.test") for _ in range(3)))
+
+    results = asyncio.run(scenario())
+    assert fetched == ["https://lead.test/"]
+    assert all(details["emails"] == ["sales@lead.test"] for details in results)
@@ -0,0 +1,42 @@
+import asyncio
+import pytest
+from models.schemas import Lead
+from services import lead_store as lead_store_module
+from services.lead_store import MemoryLeadStore, SQLiteLeadStore
+
+def make_lead(index: int, industry: str = "Retail") -> Lead:
+    return Lead(id=f"lead-{index}", company=f"Company {index}", industry=industry, location="Austin, TX")
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    store = MemoryLeadStore() if request.param == "memory" else SQLiteLeadStore(str(tmp_path / "leads.db"))
+    asyncio.run(store.start())
+    yield store
+    asyncio.run(store.close())
+
+def page_through(store, **filters):
+    async def scenario():
+        ids, cursor = [], None
+        while True:
+            leads, cursor = await store.query_leads(limit=3, before_seq=cursor, fields=["id"], **filters)
+            ids.extend(lead["id"] for lead in leads)
+            if cursor is None:
+                return ids
+    return asyncio.run(scenario())
+
+def test_cursor_pages_cover_every_lead_newest_first(store):
+    asyncio.run(store.put_leads([make_lead(index, "Retail" if index % 2 else "Finance") for index in range(8)]))
+    # Rewriting a Lead Moves it to the Front Without Duplicating it
+    asyncio.run(store.put_leads([make_lead(2, "Finance")]))
+    assert page_through(store) == ["lead-2", "lead-7", "lead-6", "lead-5", "lead-4", "lead-3", "lead-1", "lead-0"]
+    assert page_through(store, industry="retail") == ["lead-7", "lead-5", "lead-3", "lead-1"]
+
+def test_updated_since_survives_a_clock_stepping_back(store, monkeypatch):
+    clock = iter([1000.0, 2000.0, 1500.0])
+    monkeypatch.setattr(lead_store_module.time, "time", lambda: next(clock))
+    for index in range(3):
+        asyncio.run(store.put_leads([make_lead(index)]))
+    # The Third Write Read an Earlier Clock but Still Counts as Written No Earlier Than the Second
+    assert page_through(store, updated_since=2000.0) == ["lead-2", "lead-1"]
+    assert page_through(store, updated_since=1000.0) == ["lead-2", "lead-1", "lead-0"]
+    assert page_through(store, updated_since=2001.0) == []
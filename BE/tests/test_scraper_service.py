@@ -0,0 +1,22 @@
+import asyncio
+import pytest
+from services.scraper_service import ScraperService
+
+def test_failed_page_keeps_the_other_pages():
+    reported = []
+
+    async def scrape_page(page_num):
+        if page_num == 2:
+            raise RuntimeError("page 2 timed out")
+        return [{"company": f"Company {page_num}"}]
+
+    pages = asyncio.run(ScraperService()._scrape_pages(scrape_page, 3, lambda page_num, companies: reported.append(page_num)))
+    assert pages == [[{"company": "Company 1"}], [{"company": "Company 3"}]]
+    assert sorted(reported) == [1, 3]
+
+def test_scrape_where_every_page_failed_raises():
+    async def scrape_page(page_num):
+        raise RuntimeError(f"page {page_num} timed out")
+
+    with pytest.raises(RuntimeError, match="page 1"):
+        asyncio.run(ScraperService()._scrape_pages(scrape_page, 2, None))
@@ -0,0 +1,45 @@
+import asyncio
+from services.single_flight import SingleFlight
+
+def test_work_survives_until_the_last_waiter_leaves():
+    single_flight = SingleFlight()
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def work():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def scenario():
+        first = asyncio.create_task(single_flight.do("key", work))
+        second = asyncio.create_task(single_flight.do("key", work))
+        await started.wait()
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        assert not cancelled.is_set()
+
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+        assert cancelled.is_set()
+        assert single_flight.stats() == {"in_flight": 0, "shared": 1, "abandoned": 1}
+
+    asyncio.run(scenario())
+
+def test_waiters_share_one_result():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def scenario():
+        return await asyncio.gather(*(single_flight.do("key", work) for _ in range(3)))
+
+    assert asyncio.run(scenario()) == ["done"] * 3
+    assert len(calls) == 1
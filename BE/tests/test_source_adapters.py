@@ -0,0 +1,29 @@
+import pytest
+from models.schemas import Contact
+from services.source_adapters import SourceAdapter, normalize, normalize_all
+
+ORGANIZATION = {"name": "Acme Robotics", "industry": "Technology", "city": "Austin", "state": "TX", "estimated_num_employees": 120}
+
+def test_batch_and_streaming_paths_build_the_same_leads():
+    records = [{"organization": ORGANIZATION, "person": {"name": "Ada", "email": "ada@acme.test"}}]
+    expected = [lead.model_dump(exclude={"id"}) for lead in normalize(records, "apollo_api")]
+    assert [lead.model_dump(exclude={"id"}) for lead in normalize_all(records, "apollo_api")] == expected
+    assert expected[0]["contact"] == "Ada (ada@acme.test)"
+    assert expected[0]["priority"] == "Medium"
+
+def test_bad_record_is_skipped_and_contacts_stay_with_their_lead():
+    contacts = [Contact(name="Grace", email="grace@acme.test")]
+    records = [
+        {"organization": {**ORGANIZATION, "name": None}},
+        {"organization": ORGANIZATION, "person": {}, "contacts": contacts}
+    ]
+    leads = normalize_all(records, "apollo_api")
+    assert [lead.company for lead in leads] == ["Acme Robotics"]
+    assert leads[0].contacts == contacts
+
+def test_adapters_must_map_fields():
+    class Incomplete(SourceAdapter):
+        source = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,22 @@
+from services.text_index import InvertedIndex, fts5_query, tokenize
+
+def test_tokenize_folds_case_and_diacritics():
+    assert tokenize("Café Señor ZÜRICH") == ["cafe", "senor", "zurich"]
+
+def test_search_matches_unaccented_query_and_prefix():
+    index = InvertedIndex()
+    index.add("a", "Café Roma · Restaurants")
+    index.add("b", "Cafeteria Uno · Catering")
+    assert [doc for doc, _ in index.search("cafe roma", 10)] == ["a"]
+    assert sorted(doc for doc, _ in index.search("caf", 10)) == ["a", "b"]
+
+def test_readding_a_document_replaces_it():
+    index = InvertedIndex()
+    index.add("a", "Old Name")
+    index.add("a", "New Name")
+    assert index.search("old", 10) == []
+    assert len(index) == 1
+
+def test_fts5_query_quotes_terms():
+    assert fts5_query('Café "OR" x') == '"cafe" AND "or" AND "x"*'
+    assert fts5_query("!!") is None
@@ -13,11 +13,19 @@ export default function App() {
 
   const fetchLeads = async () => {
     try {
-      const response = await fetch("http://localhost:8000/api/leads");
-      if (response.ok) {
+      // /leads is Paginated: Follow next_cursor Until Every Stored Lead is Loaded
+      const allLeads: any[] = [];
+      let cursor: string | null = null;
+      do {
+        const params = new URLSearchParams({ limit: "500" });
+        if (cursor) params.set("cursor", cursor);
+        const response = await fetch(`http://localhost:8000/api/leads?${params}`);
+        if (!response.ok) break;
         const leadsData = await response.json();
-        setLeads(Array.isArray(leadsData) ? leadsData : []);
-      }
+        if (Array.isArray(leadsData?.leads)) allLeads.push(...leadsData.leads);
+        cursor = leadsData?.next_cursor ?? null;
+      } while (cursor);
+      setLeads(allLeads);
     } catch (error) {
       console.error("Failed to fetch leads:", error);
     }